@@ -1,7 +1,34 @@
 from .abc import ScreenBase, ScreenPresenting, ScreensFactoryBase
+from .diagnostics import MemoryDiagnostics, MemoryReport, ScreenMemory
 from .direction import TransitionDirection
+from .event_transition import EventTransition
+from .graph import DeadTransition, RouteEdge, RouteGraph
+from .journal import (
+    InvalidCapacityError,
+    InvalidJournalError,
+    JournalRecord,
+    NavigationJournal,
+)
+from .lazy_factory import LazyScreensFactory, UnregisteredScreenError
+from .memo import NotMemoizableError, memoized
+from .pool import NavigationEvent, RouterPool, SessionsFailedError
 from .router import Router
-from .transition import Transition
+from .routes import (
+    CompiledRoutes,
+    IncompatibleArtifactError,
+    InvalidRoutesError,
+    MissingPredicatesError,
+)
+from .shared_factory import SharedScreensFactory
+from .snapshot import NavigationSnapshot
+from .threadsafe import (
+    AsyncioScheduler,
+    ThreadSafeRouter,
+    TkinterScheduler,
+    UIScheduling,
+)
+from .throttling import Debouncer, InvalidEdgesError, Throttler
+from .transition import Transition, always
 
 __all__ = [
     "TransitionDirection",
@@ -10,4 +37,36 @@ __all__ = [
     "ScreensFactoryBase",
     "Router",
     "Transition",
+    "always",
+    "EventTransition",
+    "JournalRecord",
+    "NavigationJournal",
+    "InvalidJournalError",
+    "InvalidCapacityError",
+    "ThreadSafeRouter",
+    "UIScheduling",
+    "AsyncioScheduler",
+    "TkinterScheduler",
+    "Debouncer",
+    "Throttler",
+    "InvalidEdgesError",
+    "LazyScreensFactory",
+    "UnregisteredScreenError",
+    "CompiledRoutes",
+    "InvalidRoutesError",
+    "IncompatibleArtifactError",
+    "MissingPredicatesError",
+    "RouterPool",
+    "NavigationEvent",
+    "SessionsFailedError",
+    "SharedScreensFactory",
+    "RouteGraph",
+    "RouteEdge",
+    "DeadTransition",
+    "MemoryDiagnostics",
+    "MemoryReport",
+    "ScreenMemory",
+    "NavigationSnapshot",
+    "memoized",
+    "NotMemoizableError",
 ]
@@ -0,0 +1,64 @@
+import threading
+
+__all__ = ["_ScreenRegistry"]
+
+
+class _ScreenRegistry:
+    """The registry interning screen names to small integer ids.
+
+    Ids are assigned sequentially starting from zero, in the order in which
+    the names are first interned. Interning is safe to call from multiple threads;
+    looking up names that are already interned does not take the lock.
+    """
+
+    __slots__ = ("_ids", "_lock", "_names")
+
+    def __init__(self) -> None:
+        """Initialize new empty registry."""
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        """Get the id of the screen named `name`, assigning a new one if needed.
+
+        Args:
+            name (str): The name of the screen.
+
+        Returns:
+            The id of the screen.
+        """
+        if (screen_id := self._ids.get(name)) is not None:
+            return screen_id
+
+        with self._lock:
+            if (screen_id := self._ids.get(name)) is None:
+                screen_id = len(self._names)
+                self._names.append(name)
+                self._ids[name] = screen_id
+        return screen_id
+
+    def get(self, name: str) -> int:
+        """Get the id of the screen named `name` without interning it.
+
+        Args:
+            name (str): The name of the screen.
+
+        Returns:
+            The id of the screen, or -1 if the name was never interned.
+        """
+        return self._ids.get(name, -1)
+
+    def name(self, screen_id: int) -> str:
+        """Get the name of the screen with id `screen_id`.
+
+        Args:
+            screen_id (int): The id of the screen.
+
+        Returns:
+            The name of the screen.
+        """
+        return self._names[screen_id]
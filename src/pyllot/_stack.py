@@ -1,6 +1,9 @@
 from typing import Generic, TypeVar
 
+from ._registry import _ScreenRegistry
 from .abc import ScreenBase, ScreenPresenting
+from .diagnostics import MemoryDiagnostics
+from .snapshot import NavigationSnapshot, _StackNode
 
 _TScreen = TypeVar("_TScreen", bound=ScreenBase)
 """Type variable bound by `ScreenBase`."""
@@ -13,23 +16,46 @@ class _NavigationStack(Generic[_TScreen]):
 
     The navigation stack is composed of a stack of screens that it manages,
     and a presenter that is notified whenever a screen is pushed or popped.
+
+    The screens are kept in immutable nodes linked to the node below, along with
+    the interned ids of their names, so looking up the destination of a pop
+    compares integers instead of names. Pushing a screen adds a node on top,
+    and popping only moves the top to an existing node, so neither copies the
+    screens below, and snapshots of the stack share all of its nodes.
     """
 
-    __slots__ = ("_presenter", "_stack")
+    __slots__ = ("_diagnostics", "_presenter", "_registry", "_top")
 
     def __init__(
         self,
         presenter: ScreenPresenting[_TScreen],
         initial_screen: _TScreen,
+        registry: _ScreenRegistry | None = None,
+        diagnostics: MemoryDiagnostics | None = None,
     ):
         """Initialize new navigation stack with a presenter and initial screen.
 
         Args:
             initial_screen (_TScreen): The initial screen to put on the stack.
             presenter (ScreenPresenting[_TScreen]): The presenter of the screens.
+            registry (_ScreenRegistry | None): The registry interning screen names.
+                Defaults to `None`, meaning the stack uses its own registry.
+            diagnostics (MemoryDiagnostics | None): The optional memory diagnostics
+                measuring presenting and popping screens. Defaults to `None`.
         """
         self._presenter: ScreenPresenting[_TScreen] = presenter
-        self._stack: list[_TScreen] = [initial_screen]
+        self._registry: _ScreenRegistry = (
+            registry if registry is not None else _ScreenRegistry()
+        )
+        self._top: _StackNode[_TScreen] = _StackNode(
+            initial_screen, self._registry.intern(initial_screen.screen_name), None
+        )
+        self._diagnostics: MemoryDiagnostics | None = diagnostics
+        if diagnostics is not None:
+            diagnostics.record(initial_screen, since=diagnostics.measure())
+
+    def __len__(self) -> int:
+        return self._top.depth
 
     def push(self, screen: _TScreen) -> _TScreen:
         """Push a screen on the stack.
@@ -40,9 +66,15 @@ class _NavigationStack(Generic[_TScreen]):
         Returns:
             The destination screen.
         """
-        self.peek().will_disappear()
-        self._stack.append(screen)
+        covered = self.peek()
+        covered.will_disappear()
+        self._top = _StackNode(
+            screen, self._registry.intern(screen.screen_name), self._top
+        )
         self._present(screen)
+        # A shared instance pushed over itself stays visible.
+        if covered is not screen:
+            covered.did_suspend()
         return screen
 
     def pop(self, destination: str) -> _TScreen | None:
@@ -54,12 +86,27 @@ class _NavigationStack(Generic[_TScreen]):
         Returns:
             The destination screen if transition was successful, `None` otherwise.
         """
-        if screen := next((s for s in self._stack if s.screen_name == destination), None):
-            self.peek().will_disappear()
-            self._stack = self._stack[: self._stack.index(screen) + 1]
-            self._present(screen)
-            return screen
-        return None
+        destination_id = self._registry.get(destination)
+        target: _StackNode[_TScreen] | None = None
+        node: _StackNode[_TScreen] | None = self._top
+        while node is not None:
+            if node.screen_id == destination_id:
+                target = node
+            node = node.parent
+        if target is None:
+            return None
+
+        screen = target.screen
+        is_suspended = screen is not self._top.screen
+        self.peek().will_disappear()
+        if self._diagnostics is not None:
+            remaining: NavigationSnapshot[_TScreen] = NavigationSnapshot(target)
+            self._diagnostics.did_pop(self._above(target), remaining=remaining)
+        self._top = target
+        if is_suspended:
+            screen.will_resume()
+        self._present(screen)
+        return screen
 
     def peek(self) -> _TScreen:
         """Get the screen that is on top of the stack.
@@ -67,9 +114,46 @@ class _NavigationStack(Generic[_TScreen]):
         Returns:
             The screen on top of the stack.
         """
-        return self._stack[-1]
+        return self._top.screen
+
+    def suspended(self) -> tuple[_TScreen, ...]:
+        """Get the screens covered by the screen on top of the stack.
+
+        A shared instance of the screen on top of the stack is not suspended,
+        even when it is also covered by it.
+
+        Returns:
+            The suspended screens, from the bottom of the stack.
+        """
+        top = self._top.screen
+        return tuple(screen for screen in self.snapshot() if screen is not top)
+
+    def snapshot(self) -> NavigationSnapshot[_TScreen]:
+        """Take a snapshot of the stack.
+
+        Returns:
+            The immutable snapshot sharing the nodes of the stack.
+        """
+        return NavigationSnapshot(self._top)
+
+    def _above(self, target: _StackNode[_TScreen]) -> list[_TScreen]:
+        screens: list[_TScreen] = []
+        node: _StackNode[_TScreen] | None = self._top
+        while node is not None and node is not target:
+            screens.append(node.screen)
+            node = node.parent
+        screens.reverse()
+        return screens
 
     def _present(self, screen: _TScreen) -> None:
+        if self._diagnostics is None:
+            screen.will_present()
+            self._presenter.present(screen)
+            screen.did_present()
+            return
+
+        since = self._diagnostics.measure()
         screen.will_present()
         self._presenter.present(screen)
         screen.did_present()
+        self._diagnostics.record(screen, since=since)
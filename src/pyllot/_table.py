@@ -0,0 +1,235 @@
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from ._registry import _ScreenRegistry
+from .direction import TransitionDirection
+
+TState = TypeVar("TState")
+"""Invariant type variable for a generic state."""
+
+_Row = tuple[str, str, TransitionDirection, Callable[[TState], bool]]
+
+__all__ = ["_TransitionTable"]
+
+
+class _TransitionTable(Generic[TState]):
+    """The compact, versioned storage of transitions.
+
+    Instead of keeping one object per transition, the table stores transitions
+    in parallel arrays of interned screen ids, directions and predicate indices.
+    Identical predicates are stored only once, unless they are unhashable.
+    Rows are additionally indexed by the source screen, so looking up candidate
+    transitions for a screen does not scan the transitions of other screens.
+
+    A table is never modified once created. Adding or removing transitions
+    returns a new version, so readers holding a previous version never observe
+    a partial update. Versions created by adding rows share the parallel arrays
+    and the index with their predecessor and append to them, so adding a row
+    costs the same regardless of the size of the table. The appended rows stay
+    invisible to the predecessor, because they are beyond its length.
+    """
+
+    __slots__ = (
+        "_destinations",
+        "_directions",
+        "_length",
+        "_predicate_indices",
+        "_predicates",
+        "_predicates_lookup",
+        "_registry",
+        "_rows_by_source",
+        "_sources",
+        "_version",
+    )
+
+    @property
+    def registry(self) -> _ScreenRegistry:
+        """The registry of screen names referenced by the table."""
+        return self._registry
+
+    @property
+    def version(self) -> int:
+        """The version of the table, incremented with every change."""
+        return self._version
+
+    def __init__(
+        self,
+        registry: _ScreenRegistry,
+        version: int = 0,
+        length: int = 0,
+        columns: "_Columns | None" = None,
+    ):
+        """Initialize new table.
+
+        Args:
+            registry (_ScreenRegistry): The registry interning screen names.
+            version (int): The version of the table. Defaults to 0.
+            length (int): The number of rows visible to the table. Defaults to 0.
+            columns (_Columns | None): The storage shared with other
+                versions. Defaults to `None`, meaning new empty storage.
+        """
+        self._registry: _ScreenRegistry = registry
+        self._version: int = version
+        self._length: int = length
+        if columns is None:
+            columns = _Columns(
+                sources=array("i"),
+                destinations=array("i"),
+                directions=array("b"),
+                predicate_indices=array("i"),
+                predicates=[],
+                predicates_lookup={},
+                rows_by_source={},
+            )
+        self._sources: array[int] = columns.sources
+        self._destinations: array[int] = columns.destinations
+        self._directions: array[int] = columns.directions
+        self._predicate_indices: array[int] = columns.predicate_indices
+        self._predicates: list[Callable[[TState], bool]] = columns.predicates
+        self._predicates_lookup: dict[
+            Callable[[TState], bool], int
+        ] = columns.predicates_lookup
+        self._rows_by_source: dict[int, array[int]] = columns.rows_by_source
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> "Iterator[_Row[TState]]":
+        """Iterate over the transitions in the order of adding.
+
+        Yields:
+            The source, destination, direction and predicate of a transition.
+        """
+        for row in range(self._length):
+            yield (
+                self.source(row),
+                self.destination(row),
+                self.direction(row),
+                self.predicate(row),
+            )
+
+    def extended(self, rows: "Iterable[_Row[TState]]") -> "_TransitionTable[TState]":
+        """Create new version of the table with `rows` appended.
+
+        Args:
+            rows (Iterable[_Row[TState]]): The source, destination, direction
+                and predicate of each added transition.
+
+        Returns:
+            The new version of the table.
+        """
+        self._truncate()
+        for source, destination, direction, predicate in rows:
+            self._append(self._registry.intern(source), destination, direction, predicate)
+        return _TransitionTable(
+            self._registry,
+            version=self._version + 1,
+            length=len(self._sources),
+            columns=_Columns(
+                sources=self._sources,
+                destinations=self._destinations,
+                directions=self._directions,
+                predicate_indices=self._predicate_indices,
+                predicates=self._predicates,
+                predicates_lookup=self._predicates_lookup,
+                rows_by_source=self._rows_by_source,
+            ),
+        )
+
+    def without(self, rows: Collection[int]) -> "_TransitionTable[TState]":
+        """Create new, compacted version of the table with `rows` removed.
+
+        Removing rows renumbers the remaining ones.
+
+        Args:
+            rows (Collection[int]): The indices of the removed rows.
+
+        Returns:
+            The new version of the table.
+        """
+        empty: _TransitionTable[TState] = _TransitionTable(
+            self._registry, version=self._version
+        )
+        return empty.extended(
+            transition for row, transition in enumerate(self) if row not in rows
+        )
+
+    def rows(self, source_id: int) -> Sequence[int]:
+        """Get the rows of transitions from the screen with id `source_id`.
+
+        Args:
+            source_id (int): The id of the source screen.
+
+        Returns:
+            The indices of the rows in the order in which they were added.
+        """
+        if (rows := self._rows_by_source.get(source_id)) is None:
+            return ()
+        # The index is shared with later versions, which may append to it.
+        return rows[: bisect_left(rows, self._length)]
+
+    def source(self, row: int) -> str:
+        """Get the name of the source screen of the transition at `row`."""
+        return self._registry.name(self._sources[row])
+
+    def destination(self, row: int) -> str:
+        """Get the name of the destination screen of the transition at `row`."""
+        return self._registry.name(self._destinations[row])
+
+    def direction(self, row: int) -> TransitionDirection:
+        """Get the direction of the transition at `row`."""
+        return TransitionDirection(self._directions[row])
+
+    def predicate(self, row: int) -> Callable[[TState], bool]:
+        """Get the predicate of the transition at `row`."""
+        return self._predicates[self._predicate_indices[row]]
+
+    def _truncate(self) -> None:
+        # Drop rows appended by an interrupted update, which no version references.
+        for row in reversed(range(self._length, len(self._sources))):
+            rows = self._rows_by_source.get(self._sources[row])
+            if rows and rows[-1] == row:
+                rows.pop()
+        del self._sources[self._length :]
+        del self._destinations[self._length :]
+        del self._directions[self._length :]
+        del self._predicate_indices[self._length :]
+
+    def _append(
+        self,
+        source_id: int,
+        destination: str,
+        direction: TransitionDirection,
+        predicate: Callable[[TState], bool],
+    ) -> None:
+        try:
+            predicate_index = self._predicates_lookup.get(predicate)
+        except TypeError:
+            # Unhashable predicates are stored without deduplication.
+            predicate_index = len(self._predicates)
+            self._predicates.append(predicate)
+        if predicate_index is None:
+            predicate_index = self._predicates_lookup[predicate] = len(self._predicates)
+            self._predicates.append(predicate)
+
+        destination_id = self._registry.intern(destination)
+        row = len(self._sources)
+        self._sources.append(source_id)
+        self._destinations.append(destination_id)
+        self._directions.append(direction.value)
+        self._predicate_indices.append(predicate_index)
+        self._rows_by_source.setdefault(source_id, array("i")).append(row)
+
+
+class _Columns(NamedTuple):
+    """The storage of rows shared by versions of a table."""
+
+    sources: "array[int]"
+    destinations: "array[int]"
+    directions: "array[int]"
+    predicate_indices: "array[int]"
+    predicates: list[Callable[[Any], bool]]
+    predicates_lookup: dict[Callable[[Any], bool], int]
+    rows_by_source: dict[int, "array[int]"]
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
 __all__ = ["ScreenBase"]
 
@@ -15,10 +16,25 @@ class ScreenBase(ABC):
     * `did_present` - called on destination after presenting,
     * `will_disappear` - called on source before presenting the destination.
 
+    Screens covered by a pushed screen stay on the navigation stack, and are
+    notified when they stop and start being visible again:
+
+    * `did_suspend` - called on source after pushing and presenting the destination,
+    * `will_resume` - called on destination of a pop before presenting it again.
+
+    Override these to stop and resume refresh timers, polling or animations
+    of covered screens.
+
+    Screens that are stateless or immutable can set the `shareable` class attribute
+    to true. The `SharedScreensFactory` then reuses a single instance of such screen
+    across all routers and positions in the navigation stack.
     """
 
     __slots__ = ()
 
+    shareable: ClassVar[bool] = False
+    """Whether a single instance of the screen can be shared."""
+
     @property
     @abstractmethod
     def screen_name(self) -> str:
@@ -35,3 +51,9 @@ class ScreenBase(ABC):
     @abstractmethod
     def will_disappear(self) -> None:
         """Lifecycle method called before it gets replaced by another screen."""
+
+    def did_suspend(self) -> None:
+        """Lifecycle method called after the screen gets covered by a pushed screen."""
+
+    def will_resume(self) -> None:
+        """Lifecycle method called before the covered screen is presented again."""
@@ -0,0 +1,186 @@
+import functools
+import gc
+import json
+import os
+import tracemalloc
+import weakref
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from .abc import ScreenBase
+
+__all__ = ["MemoryDiagnostics", "MemoryReport", "ScreenMemory"]
+
+
+class ScreenMemory(NamedTuple):
+    """The memory attributed to a single screen."""
+
+    screen_name: str
+    """The name of the screen."""
+
+    retained: int
+    """The growth of allocated memory while creating and presenting the screen."""
+
+
+class MemoryReport(NamedTuple):
+    """The attribution of memory to screens."""
+
+    allocated: dict[str, int]
+    """The total growth of allocated memory while creating and presenting screens,
+    by screen name."""
+
+    live: tuple[ScreenMemory, ...]
+    """The screens on the navigation stack, in the order of creation."""
+
+    leaked: tuple[ScreenMemory, ...]
+    """The popped screens that are still alive.
+
+    Popped screens kept by a snapshot taken with `Router.snapshot` are alive,
+    so they are reported as leaked until the snapshot is freed."""
+
+
+class MemoryDiagnostics:
+    """Attributes memory allocations to screens using `tracemalloc`.
+
+    When passed to a router, the diagnostics measure the traced memory around
+    creating screens by the factory, presenting them, and popping them off
+    the navigation stack. The growth is attributed to the screen being created
+    or presented, and popped screens are watched, so the ones that are never
+    freed can be reported.
+
+    Tracing memory slows the application down, so the diagnostics are meant
+    to be enabled only when investigating memory growth.
+
+    Example:
+        ```python3
+        diagnostics = MemoryDiagnostics()
+        router = Router(
+            initial_screen=HomeScreen(),
+            presenter=MyPresenter(),
+            screens_factory=MyScreensFactory(),
+            diagnostics=diagnostics,
+        )
+        ...
+        diagnostics.dump("memory.json")
+        ```
+    """
+
+    __slots__ = ("_allocated", "_live", "_popped", "_started")
+
+    def __init__(self, frames: int = 1):
+        """Initialize new diagnostics, starting `tracemalloc` if it is not tracing.
+
+        Args:
+            frames (int): The number of frames stored for each traced allocation,
+                when `tracemalloc` is started by the diagnostics. Defaults to 1.
+        """
+        self._started: bool = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(frames)
+        self._allocated: dict[str, int] = {}
+        self._live: dict[int, tuple[ScreenBase, list[int]]] = {}
+        self._popped: dict[int, tuple[str, int, weakref.ref[ScreenBase]]] = {}
+
+    def measure(self) -> int:
+        """Get the size of memory currently traced by `tracemalloc`.
+
+        Returns:
+            The size of traced memory, in bytes.
+        """
+        return tracemalloc.get_traced_memory()[0]
+
+    def record(self, screen: ScreenBase, since: int) -> None:
+        """Attribute the growth of traced memory since `since` to the `screen`.
+
+        Args:
+            screen (ScreenBase): The created or presented screen.
+            since (int): The size of traced memory measured before, in bytes.
+        """
+        growth = max(self.measure() - since, 0)
+        name = screen.screen_name
+        self._allocated[name] = self._allocated.get(name, 0) + growth
+        if (entry := self._live.get(id(screen))) is None:
+            # A popped screen presented again is live again.
+            popped = self._popped.pop(id(screen), None)
+            retained = popped[1] if popped is not None else 0
+            self._live[id(screen)] = (screen, [retained + growth])
+        else:
+            entry[1][0] += growth
+
+    def did_pop(
+        self, screens: Iterable[ScreenBase], remaining: Iterable[ScreenBase] = ()
+    ) -> None:
+        """Start watching the popped `screens` for leaks.
+
+        Args:
+            screens (Iterable[ScreenBase]): The screens removed from the stack.
+            remaining (Iterable[ScreenBase]): The screens still on the stack.
+                Popped screens that are also among them, because the factory
+                shares their instances, stay live. Defaults to none.
+        """
+        kept = {id(screen) for screen in remaining}
+        for screen in screens:
+            key = id(screen)
+            if key in kept or key in self._popped:
+                continue
+            _, (retained,) = self._live.pop(key, (screen, [0]))
+            try:
+                reference = weakref.ref(screen, functools.partial(self._forget, key))
+            except TypeError:
+                continue
+            self._popped[key] = (screen.screen_name, retained, reference)
+
+    def report(self, collect: bool = True) -> MemoryReport:
+        """Create the report of memory attributed to screens.
+
+        Args:
+            collect (bool): Whether to run the garbage collector first, so that
+                popped screens kept alive only by reference cycles are not
+                reported as leaked. Defaults to true.
+
+        Returns:
+            The memory report.
+        """
+        if collect:
+            gc.collect()
+        popped = [
+            entry for entry in tuple(self._popped.values()) if entry[2]() is not None
+        ]
+        return MemoryReport(
+            allocated=dict(self._allocated),
+            live=tuple(
+                ScreenMemory(screen.screen_name, retained)
+                for screen, (retained,) in self._live.values()
+            ),
+            leaked=tuple(ScreenMemory(name, retained) for name, retained, _ in popped),
+        )
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write the memory report as JSON to the file at `path`.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the report file.
+        """
+        report = self.report()
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "allocated": report.allocated,
+                    "live": [screen._asdict() for screen in report.live],
+                    "leaked": [screen._asdict() for screen in report.leaked],
+                },
+                file,
+                indent=2,
+            )
+
+    def _forget(self, key: int, reference: "weakref.ref[ScreenBase]") -> None:
+        # Called when a popped screen is freed, so its entry is no longer needed.
+        entry = self._popped.get(key)
+        if entry is not None and entry[2] is reference:
+            del self._popped[key]
+
+    def stop(self) -> None:
+        """Stop `tracemalloc`, if it was started by the diagnostics."""
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
@@ -0,0 +1,95 @@
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+from .direction import TransitionDirection
+
+TEvent = TypeVar("TEvent")
+"""Invariant type variable for a generic event."""
+
+__all__ = ["EventTransition"]
+
+
+class EventTransition(Generic[TEvent]):
+    """The definition of transition from one screen to another triggered by an event.
+
+    An event transition describes a navigation from the source screen to the
+    destination screen that happens in response to a discrete event, like
+    "the user pressed X" or "the server sent Y", rather than a change of state.
+
+    The `event` is the key the transition is registered under. It can be either
+    a name or a value of the event (any hashable, like a string or an enum member),
+    or a type of the event. If a router currently shows a screen named `source`,
+    receives an event matching the key, and the optional `guard` returns true,
+    then the router will navigate to a screen named `destination`.
+    """
+
+    __slots__ = ("_source", "_destination", "_event", "_guard", "_direction")
+
+    @property
+    def source(self) -> str:
+        """The name of the screen to transition from."""
+        return self._source
+
+    @property
+    def destination(self) -> str:
+        """The name of the screen to transition to."""
+        return self._destination
+
+    @property
+    def event(self) -> Hashable:
+        """The name, value or type of the event that triggers the transition."""
+        return self._event
+
+    @property
+    def direction(self) -> TransitionDirection:
+        """The direction of the transition."""
+        return self._direction
+
+    _source: str
+    _destination: str
+    _event: Hashable
+    _direction: TransitionDirection
+    _guard: Callable[[TEvent], bool] | None
+
+    def __init__(
+        self,
+        source: str,
+        destination: str,
+        direction: TransitionDirection,
+        event: Hashable,
+        guard: Callable[[TEvent], bool] | None = None,
+    ):
+        """Initialize new event transition.
+
+        Args:
+            source (str): The name of the source screen.
+            destination (str): The name of the destination screen.
+            direction (TransitionDirection): The direction of the transition.
+            event (Hashable): The name, value or type of the triggering event.
+            guard (Callable[[TEvent], bool] | None): The optional predicate
+                evaluated with the received event. Defaults to `None`,
+                meaning that every matching event triggers the transition.
+        """
+        self._source = source
+        self._destination = destination
+        self._direction = direction
+        self._event = event
+        self._guard = guard
+
+    def should_transition(self, event: TEvent) -> bool:
+        """Evaluate whether the transition should be performed given the `event`.
+
+        Args:
+            event (TEvent): The received event.
+
+        Returns:
+            True if transition should be performed; false otherwise.
+        """
+        return self._guard is None or self._guard(event)
+
+    def __repr__(self) -> str:
+        return (
+            f"EventTransition(source={self._source}, destination={self._destination}, "
+            f"direction={self._direction.name}, event={self._event!r}, "
+            f"guard={self._guard!r})"
+        )
@@ -0,0 +1,236 @@
+from collections import deque
+from collections.abc import Callable, Container, Iterable, Sequence
+from typing import Any, NamedTuple
+
+from .direction import TransitionDirection
+from .transition import always
+
+__all__ = ["DeadTransition", "RouteEdge", "RouteGraph"]
+
+
+class RouteEdge(NamedTuple):
+    """A transition of the route graph."""
+
+    position: int
+    """The position of the transition, in the order of adding to the router."""
+
+    source: str
+    """The name of the screen to transition from."""
+
+    destination: str
+    """The name of the screen to transition to."""
+
+    direction: TransitionDirection
+    """The direction of the transition."""
+
+
+class DeadTransition(NamedTuple):
+    """A transition that can never be performed."""
+
+    edge: RouteEdge
+    """The dead transition."""
+
+    reason: str
+    """The explanation why the transition can never be performed."""
+
+
+class RouteGraph:
+    """The analysis of transitions as a graph of screens.
+
+    The graph is built from transitions in the order in which they were added
+    to a router, and an initial screen. It detects transitions that can never
+    be performed:
+
+    * transitions from screens that are not reachable from the initial screen,
+    * pop transitions to screens that can never be on the stack below the source,
+    * transitions shadowed by an earlier unconditional transition from the same
+      source, that is one with the `always` predicate.
+
+    Reachability and shortest paths are computed over the remaining transitions.
+    A screen can be below another screen on the stack only if it pushed a screen,
+    from which the other screen is reachable with pushes. Pushes performed by
+    event transitions count towards reachability too.
+
+    Use `Router.analyze` to build the graph of a router, and drop the dead
+    transitions from it.
+    """
+
+    __slots__ = ("_dead", "_edges", "_initial_screen", "_paths", "_reachable")
+
+    @property
+    def initial_screen(self) -> str:
+        """The name of the initial screen."""
+        return self._initial_screen
+
+    @property
+    def edges(self) -> tuple[RouteEdge, ...]:
+        """All transitions of the graph, including the dead ones."""
+        return self._edges
+
+    @property
+    def dead_transitions(self) -> tuple[DeadTransition, ...]:
+        """The transitions that can never be performed."""
+        return self._dead
+
+    @property
+    def reachable_screens(self) -> frozenset[str]:
+        """The names of screens reachable from the initial screen."""
+        return self._reachable
+
+    def __init__(
+        self,
+        transitions: Iterable[
+            tuple[str, str, TransitionDirection, Callable[[Any], bool]]
+        ],
+        initial_screen: str,
+        event_transitions: Iterable[tuple[str, str, TransitionDirection]] = (),
+    ):
+        """Build and analyze the graph.
+
+        Args:
+            transitions (Iterable[tuple[str, str, TransitionDirection, Callable]]):
+                The source, destination, direction and predicate of each transition,
+                in the order of adding to the router.
+            initial_screen (str): The name of the initial screen.
+            event_transitions (Iterable[tuple[str, str, TransitionDirection]]):
+                The source, destination and direction of each event transition.
+                Event transitions are never reported as dead, but screens pushed
+                by them are reachable. Defaults to none.
+        """
+        rows = list(transitions)
+        self._initial_screen: str = initial_screen
+        self._edges: tuple[RouteEdge, ...] = tuple(
+            RouteEdge(position, source, destination, direction)
+            for position, (source, destination, direction, _) in enumerate(rows)
+        )
+        dead = _find_shadowed(self._edges, [predicate for *_, predicate in rows])
+
+        pushes: dict[str, list[str]] = {}
+        for source, destination, direction in [
+            (edge.source, edge.destination, edge.direction)
+            for edge in self._edges
+            if edge.position not in dead
+        ] + list(event_transitions):
+            if direction == TransitionDirection.PUSH:
+                pushes.setdefault(source, []).append(destination)
+        self._reachable: frozenset[str] = frozenset(_closure([initial_screen], pushes))
+        dead.update(_find_impossible(self._edges, dead, self._reachable, pushes))
+
+        self._dead: tuple[DeadTransition, ...] = tuple(
+            DeadTransition(self._edges[position], reason)
+            for position, reason in sorted(dead.items())
+        )
+        outgoing: dict[str, list[RouteEdge]] = {}
+        for edge in self._edges:
+            if edge.position not in dead:
+                outgoing.setdefault(edge.source, []).append(edge)
+        self._paths: dict[str, dict[str, RouteEdge]] = {
+            screen: _shortest_path_tree(screen, outgoing) for screen in self._reachable
+        }
+
+    def is_reachable(self, source: str, destination: str) -> bool:
+        """Check whether the `destination` screen can be reached from the `source`.
+
+        Args:
+            source (str): The name of the source screen.
+            destination (str): The name of the destination screen.
+
+        Returns:
+            True if there is a path of live transitions; false otherwise.
+        """
+        return source == destination or destination in self._paths.get(source, {})
+
+    def shortest_path(self, source: str, destination: str) -> list[RouteEdge] | None:
+        """Find the shortest sequence of transitions between two screens.
+
+        Args:
+            source (str): The name of the source screen.
+            destination (str): The name of the destination screen.
+
+        Returns:
+            The transitions to perform, in order, or `None` if the destination
+            is not reachable from the source.
+
+        Note:
+            Paths do not track the contents of the stack, so a pop transition
+            on the path assumes its destination is below the source.
+        """
+        if source == destination:
+            return []
+        tree = self._paths.get(source, {})
+        if destination not in tree:
+            return None
+
+        path: list[RouteEdge] = []
+        while destination != source:
+            edge = tree[destination]
+            path.append(edge)
+            destination = edge.source
+        path.reverse()
+        return path
+
+
+def _is_unconditional(predicate: Callable[[Any], bool]) -> bool:
+    return predicate is always
+
+
+def _find_shadowed(
+    edges: Sequence[RouteEdge], predicates: Sequence[Callable[[Any], bool]]
+) -> dict[int, str]:
+    shadowing: dict[str, RouteEdge] = {}
+    dead: dict[int, str] = {}
+    for edge, predicate in zip(edges, predicates, strict=True):
+        if (earlier := shadowing.get(edge.source)) is not None:
+            dead[
+                edge.position
+            ] = f"shadowed by unconditional transition {earlier.position}"
+        elif _is_unconditional(predicate):
+            shadowing[edge.source] = edge
+    return dead
+
+
+def _find_impossible(
+    edges: Iterable[RouteEdge],
+    dead: Container[int],
+    reachable: Container[str],
+    pushes: dict[str, list[str]],
+) -> dict[int, str]:
+    impossible: dict[int, str] = {}
+    above: dict[str, set[str]] = {}
+    for position, source, destination, direction in edges:
+        if position in dead:
+            continue
+        if source not in reachable:
+            impossible[position] = "source is not reachable from the initial screen"
+            continue
+        if direction != TransitionDirection.POP or destination == source:
+            continue
+        if destination not in above:
+            above[destination] = _closure(pushes.get(destination, ()), pushes)
+        if source not in above[destination]:
+            impossible[position] = "destination can never be below the source"
+    return impossible
+
+
+def _closure(starts: Iterable[str], pushes: dict[str, list[str]]) -> set[str]:
+    visited = set(starts)
+    queue = deque(visited)
+    while queue:
+        for destination in pushes.get(queue.popleft(), ()):
+            if destination not in visited:
+                visited.add(destination)
+                queue.append(destination)
+    return visited
+
+
+def _shortest_path_tree(
+    source: str, outgoing: dict[str, list[RouteEdge]]
+) -> dict[str, RouteEdge]:
+    tree: dict[str, RouteEdge] = {}
+    queue = deque([source])
+    while queue:
+        for edge in outgoing.get(queue.popleft(), ()):
+            if edge.destination != source and edge.destination not in tree:
+                tree[edge.destination] = edge
+                queue.append(edge.destination)
+    return tree
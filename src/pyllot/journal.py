@@ -0,0 +1,211 @@
+import mmap
+import os
+import struct
+import time
+from typing import NamedTuple
+
+from .direction import TransitionDirection
+
+__all__ = [
+    "InvalidCapacityError",
+    "InvalidJournalError",
+    "JournalRecord",
+    "NavigationJournal",
+]
+
+_MAGIC = b"PYLJ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBxHIQ")
+_RECORD = struct.Struct("<dIIBH")
+_MAX_DEPTH = 0xFFFF
+
+
+class InvalidCapacityError(ValueError):
+    """The capacity of a journal is not positive."""
+
+    def __init__(self, capacity: int):
+        """Initialize new error for the invalid `capacity`.
+
+        Args:
+            capacity (int): The invalid capacity.
+        """
+        super().__init__(f"Journal capacity must be positive, got {capacity}.")
+
+
+class InvalidJournalError(ValueError):
+    """The file is not a navigation journal, or has an unsupported version."""
+
+    def __init__(self, path: str | os.PathLike[str], version: int | None = None):
+        """Initialize new error for the journal file at `path`.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the file.
+            version (int | None): The unsupported version of the journal.
+                Defaults to `None`, meaning the file is not a journal at all.
+        """
+        if version is None:
+            super().__init__(f"{os.fspath(path)} is not a navigation journal.")
+        else:
+            super().__init__(
+                f"{os.fspath(path)} has unsupported journal version {version}."
+            )
+
+
+class JournalRecord(NamedTuple):
+    """A single navigation decision read from a journal."""
+
+    timestamp: float
+    """The wall-clock time of the decision, in seconds since the epoch."""
+
+    transition: int
+    """The index of the performed transition, in the order of adding to the router."""
+
+    transitions_version: int
+    """The version of the router's transitions the `transition` index refers to."""
+
+    direction: TransitionDirection
+    """The direction of the performed transition."""
+
+    depth: int
+    """The depth of the navigation stack after the transition."""
+
+
+class NavigationJournal:
+    """Records navigation decisions to a compact binary ring-buffer file.
+
+    Every decision is stored as a fixed-size record containing the timestamp,
+    the index of the performed transition, the version of the transitions,
+    the direction and the resulting depth of the navigation stack. The source
+    and destination screens are those of the transition at the index, so screen
+    names are not recorded, and neither is any part of the application's state.
+
+    Removing transitions renumbers the remaining ones, so an index is meaningful
+    only together with the version of the transitions it was recorded with.
+
+    The file is memory-mapped and holds at most `capacity` records. When full,
+    the oldest records are overwritten.
+
+    Example:
+        ```python3
+        journal = NavigationJournal("navigation.journal")
+        router = Router(
+            initial_screen=HomeScreen(),
+            presenter=MyPresenter(),
+            screens_factory=MyScreensFactory(),
+            journal=journal,
+        )
+        ```
+    """
+
+    __slots__ = ("_capacity", "_count", "_file", "_mmap")
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of records kept in the file."""
+        return self._capacity
+
+    def __init__(self, path: str | os.PathLike[str], capacity: int = 65536):
+        """Create new journal file at `path`, replacing any existing file.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the journal file.
+            capacity (int): The maximum number of records kept in the file.
+                Defaults to 65536.
+
+        Raises:
+            InvalidCapacityError: The `capacity` is not positive.
+        """
+        if capacity <= 0:
+            raise InvalidCapacityError(capacity)
+
+        self._capacity: int = capacity
+        self._count: int = 0
+        self._file = open(path, "w+b")  # noqa: SIM115
+        self._file.truncate(_HEADER.size + capacity * _RECORD.size)
+        self._mmap: mmap.mmap = mmap.mmap(self._file.fileno(), 0)
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, _RECORD.size, capacity, 0)
+
+    def record(
+        self,
+        transition: int,
+        transitions_version: int,
+        direction: TransitionDirection,
+        depth: int,
+    ) -> None:
+        """Append a navigation decision.
+
+        Args:
+            transition (int): The index of the performed transition.
+            transitions_version (int): The version of the transitions.
+            direction (TransitionDirection): The direction of the performed transition.
+            depth (int): The depth of the navigation stack after the transition.
+        """
+        offset = _HEADER.size + (self._count % self._capacity) * _RECORD.size
+        _RECORD.pack_into(
+            self._mmap,
+            offset,
+            time.time(),
+            transition,
+            transitions_version,
+            direction.value,
+            min(depth, _MAX_DEPTH),
+        )
+        self._count += 1
+        _HEADER.pack_into(
+            self._mmap, 0, _MAGIC, _VERSION, _RECORD.size, self._capacity, self._count
+        )
+
+    def close(self) -> None:
+        """Flush the recorded decisions and close the file."""
+        if not self._mmap.closed:
+            self._mmap.flush()
+            self._mmap.close()
+            self._file.close()
+
+    def __enter__(self) -> "NavigationJournal":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @staticmethod
+    def read(path: str | os.PathLike[str]) -> list[JournalRecord]:
+        """Read the decisions retained in the journal file at `path`.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the journal file.
+
+        Returns:
+            The retained records, from the oldest to the newest.
+
+        Raises:
+            InvalidJournalError: The file is not a journal, or has an unsupported
+                version.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < _HEADER.size:
+            raise InvalidJournalError(path)
+        magic, version, record_size, capacity, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise InvalidJournalError(path)
+        if version != _VERSION or record_size != _RECORD.size:
+            raise InvalidJournalError(path, version=version)
+
+        first = max(count - capacity, 0)
+        return [
+            JournalRecord(
+                timestamp,
+                transition,
+                transitions_version,
+                TransitionDirection(direction),
+                depth,
+            )
+            for timestamp, transition, transitions_version, direction, depth in (
+                _RECORD.unpack_from(
+                    data, _HEADER.size + (index % capacity) * _RECORD.size
+                )
+                for index in range(first, count)
+            )
+        ]
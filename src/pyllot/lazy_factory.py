@@ -0,0 +1,125 @@
+import importlib
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from .abc import ScreenBase, ScreensFactoryBase
+
+TScreen = TypeVar("TScreen", bound=ScreenBase, covariant=True)
+"""Covariant type variable bound by `ScreenBase`."""
+
+__all__ = ["LazyScreensFactory", "UnregisteredScreenError"]
+
+
+class UnregisteredScreenError(NotImplementedError):
+    """The screen is not registered in the factory."""
+
+    def __init__(self, screen_name: str):
+        """Initialize new error for the screen named `screen_name`.
+
+        Args:
+            screen_name (str): The name of the unregistered screen.
+        """
+        super().__init__(f"Screen {screen_name!r} is not registered.")
+
+
+class LazyScreensFactory(ScreensFactoryBase[TScreen]):
+    """Factory creating screens registered by their import paths.
+
+    Each screen name is mapped to an import path of the screen class and keyword
+    arguments passed to its constructor. The module of a screen is imported only
+    when the screen is created for the first time, so screen modules and their
+    dependencies do not have to be loaded at startup.
+
+    Optionally, modules of selected screens can be warmed up in a background
+    thread. Importing holds the import lock and competes with the presentation
+    for the GIL, so the warm-up is never started automatically; call
+    `start_warm_up` once the first screen has been presented.
+
+    Example:
+        ```python3
+        from pyllot import LazyScreensFactory
+
+        factory: LazyScreensFactory[MyScreen] = LazyScreensFactory(
+            warm_up=["video_player"]
+        )
+        factory.register("home", "myapp.screens.home:HomeScreen")
+        factory.register(
+            "video_player", "myapp.screens.player:VideoPlayerScreen", autoplay=True
+        )
+        ...
+        presenter.present(home_screen)
+        factory.start_warm_up()
+        ```
+    """
+
+    __slots__ = ("_classes", "_lock", "_paths", "_warm_up", "_warm_up_thread")
+
+    def __init__(self, warm_up: Iterable[str] = ()):
+        """Initialize new factory without any screens.
+
+        Args:
+            warm_up (Iterable[str]): The names of the screens whose modules are
+                imported in a background thread by `start_warm_up`. Defaults to none.
+        """
+        self._paths: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._classes: dict[str, Callable[..., TScreen]] = {}
+        self._warm_up: tuple[str, ...] = tuple(warm_up)
+        self._warm_up_thread: threading.Thread | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def register(self, screen_name: str, path: str, **kwargs: Any) -> None:
+        """Register a screen named `screen_name` without importing it.
+
+        Args:
+            screen_name (str): The name of the screen.
+            path (str): The import path of the screen class, either
+                in the `package.module:ClassName` or `package.module.ClassName` form.
+            **kwargs (Any): The keyword arguments passed to the constructor.
+        """
+        self._paths[screen_name] = (path, kwargs)
+
+    def create(self, screen_name: str) -> TScreen:
+        """Create new screen named `screen_name`, importing its module if needed.
+
+        Args:
+            screen_name (str): The name of the screen to create.
+
+        Returns:
+            TScreen: The created screen.
+
+        Raises:
+            UnregisteredScreenError: The screen named `screen_name` is not registered.
+        """
+        return self._resolve(screen_name)(**self._paths[screen_name][1])
+
+    def start_warm_up(self) -> None:
+        """Start importing modules of the warm-up screens in a background thread.
+
+        Call this method after the first screen has been presented, so that
+        the imports do not delay the first presentation. Calling this method
+        more than once has no effect.
+        """
+        with self._lock:
+            if self._warm_up_thread is not None:
+                return
+            self._warm_up_thread = threading.Thread(
+                target=self._run_warm_up, name="pyllot-warm-up", daemon=True
+            )
+        self._warm_up_thread.start()
+
+    def _run_warm_up(self) -> None:
+        for screen_name in self._warm_up:
+            self._resolve(screen_name)
+
+    def _resolve(self, screen_name: str) -> Callable[..., TScreen]:
+        if (cls := self._classes.get(screen_name)) is not None:
+            return cls
+        if screen_name not in self._paths:
+            raise UnregisteredScreenError(screen_name)
+
+        path = self._paths[screen_name][0]
+        module_name, _, attribute = path.rpartition(":" if ":" in path else ".")
+        cls = getattr(importlib.import_module(module_name), attribute)
+        self._classes[screen_name] = cls
+        return cls
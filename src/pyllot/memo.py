@@ -0,0 +1,112 @@
+import functools
+import inspect
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar, Token
+from typing import Any, TypeVar
+
+TResult = TypeVar("TResult")
+"""Type variable for the result of a memoized helper."""
+
+__all__ = ["NotMemoizableError", "memoized"]
+
+_Scope = dict[tuple[Hashable, ...], tuple[Any, Any]]
+
+_scope: ContextVar[_Scope | None] = ContextVar("pyllot_memo_scope", default=None)
+
+
+class NotMemoizableError(TypeError):
+    """The helper cannot be memoized, because it is a coroutine function."""
+
+    def __init__(self, helper: Callable[..., Any]):
+        """Initialize new error for the `helper`.
+
+        Args:
+            helper (Callable[..., Any]): The helper that cannot be memoized.
+        """
+        super().__init__(f"Cannot memoize coroutine function {helper.__qualname__}.")
+
+
+def memoized(helper: Callable[..., TResult]) -> Callable[..., TResult]:
+    """Memoize a predicate helper for the duration of a single evaluation of a state.
+
+    While a router evaluates a state in `Router.on_state` or `Router.on_state_async`,
+    a decorated helper computes its result at most once for the same state
+    and arguments, no matter how many transition predicates call it. The results
+    are discarded when the evaluation returns, so they never leak into the
+    evaluation of the next state. Outside an evaluation, the helper is simply called.
+
+    The first argument of the helper is the state, compared by identity. Other
+    positional arguments must be hashable to be memoized; calls with unhashable
+    arguments are not memoized.
+
+    Example:
+        ```python3
+        @memoized
+        def has_current_video(state: State) -> bool:
+            return state.current_video_url is not None
+
+
+        router.add_transition(
+            Transition(
+                source="home",
+                destination="video",
+                direction=TransitionDirection.PUSH,
+                condition=has_current_video,
+            )
+        )
+        ```
+
+    Args:
+        helper (Callable[..., TResult]): The helper taking the state as the first
+            argument. Must not be a coroutine function.
+
+    Returns:
+        The memoized helper.
+
+    Raises:
+        NotMemoizableError: The `helper` is a coroutine function.
+    """
+    if inspect.iscoroutinefunction(helper):
+        raise NotMemoizableError(helper)
+
+    @functools.wraps(helper)
+    def wrapper(state: Any, *args: Any) -> TResult:
+        if (scope := _scope.get()) is None:
+            return helper(state, *args)
+
+        key = (wrapper, id(state), args)
+        try:
+            entry = scope.get(key)
+        except TypeError:
+            return helper(state, *args)
+        # The state is kept with the result, so a recycled id never matches.
+        if entry is not None and entry[0] is state:
+            return entry[1]
+
+        result = helper(state, *args)
+        scope[key] = (state, result)
+        return result
+
+    return wrapper
+
+
+class _EvaluationScope:
+    """The scope of memoized results of a single evaluation of a state.
+
+    Entering a scope while another one is active, for example when a router
+    forwards the state to its child, reuses the outer scope.
+    """
+
+    __slots__ = ("_token",)
+
+    def __init__(self) -> None:
+        self._token: Token[_Scope | None] | None = None
+
+    def __enter__(self) -> None:
+        if _scope.get() is None:
+            self._token = _scope.set({})
+
+    def __exit__(self, *args: object) -> None:
+        if self._token is not None:
+            _scope.reset(self._token)
+            self._token = None
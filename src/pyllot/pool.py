@@ -0,0 +1,271 @@
+import multiprocessing
+import pickle
+from collections.abc import Callable, Hashable, Iterable
+from multiprocessing.connection import Connection
+from typing import Any, Generic, Literal, NamedTuple, TypeVar
+
+from .router import Router
+
+TState = TypeVar("TState")
+"""Invariant type variable for a generic state."""
+
+__all__ = ["NavigationEvent", "RouterPool", "SessionsFailedError"]
+
+_STATES = "states"
+_END = "end"
+_STOP = "stop"
+
+
+class NavigationEvent(NamedTuple):
+    """A navigation performed by a router of a session."""
+
+    session_id: Hashable
+    """The id of the session."""
+
+    source: str
+    """The name of the screen displayed before the navigation."""
+
+    destination: str
+    """The name of the screen displayed after the navigation."""
+
+    depth: int
+    """The depth of the navigation stack after the navigation."""
+
+
+class SessionsFailedError(Exception):
+    """Evaluating states of some sessions raised an exception."""
+
+    @property
+    def events(self) -> list[NavigationEvent]:
+        """The navigations performed by the other sessions of the batch."""
+        return self._events
+
+    @property
+    def failures(self) -> dict[Hashable, Exception]:
+        """The exceptions raised by the failed sessions, by session id."""
+        return self._failures
+
+    def __init__(
+        self, events: list[NavigationEvent], failures: dict[Hashable, Exception]
+    ):
+        """Initialize new error for the `failures` of a batch.
+
+        Args:
+            events (list[NavigationEvent]): The performed navigations.
+            failures (dict[Hashable, Exception]): The exceptions raised
+                by the failed sessions, by session id.
+        """
+        self._events: list[NavigationEvent] = events
+        self._failures: dict[Hashable, Exception] = failures
+        super().__init__(f"Evaluating states of {len(failures)} session(s) failed.")
+
+
+class RouterPool(Generic[TState]):
+    """Pool of worker processes running routers of many sessions.
+
+    Every session has its own router, created in a worker process by the
+    `router_factory` when the session receives its first state. Sessions are
+    sharded across the workers by their id, so the router of a session, including
+    its navigation stack, always lives in the same worker.
+
+    The pool is meant for headless, server-side navigation, where routers use
+    a no-op or recording presenter, and scales the evaluation of states
+    with the number of cores.
+
+    The `router_factory` and the states must be picklable.
+
+    Example:
+        ```python3
+        def create_router() -> Router[State, MyScreen]:
+            return Router(
+                initial_screen=HomeScreen(),
+                presenter=NullPresenter(),
+                screens_factory=MyScreensFactory(),
+            )
+
+
+        with RouterPool(create_router, processes=4) as pool:
+            events = pool.on_states([("session-1", state), ("session-2", state)])
+        ```
+    """
+
+    __slots__ = ("_connections", "_processes")
+
+    @property
+    def processes(self) -> int:
+        """The number of worker processes."""
+        return len(self._processes)
+
+    def __init__(
+        self,
+        router_factory: Callable[[], Router[TState, Any]],
+        processes: int | None = None,
+        start_method: Literal["fork", "forkserver", "spawn"] | None = None,
+    ):
+        """Start new pool of worker processes.
+
+        Args:
+            router_factory (Callable[[], Router[TState, Any]]): The factory creating
+                a router for a new session.
+            processes (int | None): The number of worker processes. Defaults
+                to `None`, meaning the number of CPUs.
+            start_method (Literal["fork", "forkserver", "spawn"] | None): The
+                `multiprocessing` start method. Defaults to `None`, meaning
+                the platform default.
+        """
+        context = multiprocessing.get_context(start_method)
+        self._connections: list[Connection] = []
+        self._processes: list[multiprocessing.process.BaseProcess] = []
+        for index in range(processes or multiprocessing.cpu_count()):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_run_worker,
+                args=(router_factory, worker_connection),
+                name=f"pyllot-router-pool-{index}",
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+    def on_states(
+        self, updates: Iterable[tuple[Hashable, TState]]
+    ) -> list[NavigationEvent]:
+        """Evaluate a batch of states by the routers of their sessions.
+
+        The batch is split by worker and evaluated by all workers in parallel.
+        States of the same session are evaluated in the order of the batch.
+
+        When evaluating a state of a session raises, the remaining states of that
+        session in the batch are skipped, while other sessions are still evaluated.
+        Exceptions that cannot be sent from the worker are replaced
+        by a `RuntimeError` describing them.
+
+        Args:
+            updates (Iterable[tuple[Hashable, TState]]): The pairs of session ids
+                and their new states.
+
+        Returns:
+            The performed navigations, grouped by worker, in the order of evaluation.
+
+        Raises:
+            SessionsFailedError: Evaluating states of some sessions raised.
+                The error holds the navigations performed by the other sessions.
+        """
+        events: list[NavigationEvent] = []
+        failures: dict[Hashable, Exception] = {}
+        for worker_events, worker_failures in self._request(
+            _STATES, self._shard(updates)
+        ):
+            events.extend(worker_events)
+            failures.update(worker_failures)
+        if failures:
+            raise SessionsFailedError(events, failures)
+        return events
+
+    def end_sessions(self, session_ids: Iterable[Hashable]) -> None:
+        """Discard the routers of the sessions.
+
+        Args:
+            session_ids (Iterable[Hashable]): The ids of the ended sessions.
+        """
+        self._request(_END, self._shard((session_id, None) for session_id in session_ids))
+
+    def close(self) -> None:
+        """Stop the worker processes and wait for them to exit."""
+        for connection in self._connections:
+            connection.send((_STOP, None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections.clear()
+        self._processes.clear()
+
+    def __enter__(self) -> "RouterPool[TState]":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _shard(self, updates: Iterable[tuple[Hashable, Any]]) -> list[list[Any]]:
+        batches: list[list[Any]] = [[] for _ in self._connections]
+        for update in updates:
+            batches[hash(update[0]) % len(batches)].append(update)
+        return batches
+
+    def _request(self, command: str, batches: list[list[Any]]) -> list[Any]:
+        pending = [
+            connection
+            for connection, batch in zip(self._connections, batches, strict=True)
+            if batch
+        ]
+        for connection, batch in zip(self._connections, batches, strict=True):
+            if batch:
+                connection.send((command, batch))
+
+        results = [connection.recv() for connection in pending]
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+
+def _run_worker(
+    router_factory: Callable[[], Router[Any, Any]], connection: Connection
+) -> None:
+    routers: dict[Hashable, Router[Any, Any]] = {}
+    while True:
+        command, batch = connection.recv()
+        if command == _STOP:
+            break
+        try:
+            if command == _END:
+                for session_id, _ in batch:
+                    routers.pop(session_id, None)
+                connection.send(None)
+            else:
+                connection.send(_evaluate(router_factory, routers, batch))
+        except Exception as error:
+            connection.send(_picklable(error))
+    connection.close()
+
+
+def _evaluate(
+    router_factory: Callable[[], Router[Any, Any]],
+    routers: dict[Hashable, Router[Any, Any]],
+    batch: list[tuple[Hashable, Any]],
+) -> tuple[list[NavigationEvent], dict[Hashable, Exception]]:
+    events: list[NavigationEvent] = []
+    failures: dict[Hashable, Exception] = {}
+    for session_id, state in batch:
+        if session_id in failures:
+            continue
+        try:
+            if (router := routers.get(session_id)) is None:
+                router = routers[session_id] = router_factory()
+            source = router.current_screen
+            router.on_state(state)
+        except Exception as error:
+            failures[session_id] = _picklable(error)
+            continue
+
+        if (destination := router.current_screen) is not source:
+            events.append(
+                NavigationEvent(
+                    session_id=session_id,
+                    source=source.screen_name,
+                    destination=destination.screen_name,
+                    depth=router.depth,
+                )
+            )
+    return events, failures
+
+
+def _picklable(error: Exception) -> Exception:
+    # Sending an exception that cannot be unpickled would kill the worker.
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(f"{type(error).__qualname__}: {error}")
+    return error
@@ -0,0 +1,185 @@
+import os
+import time
+from collections.abc import Iterable, Sequence
+from functools import partial
+from operator import eq
+from typing import Any, NamedTuple
+
+from .abc import ScreenBase, ScreensFactoryBase
+from .journal import NavigationJournal
+from .router import Router
+from .transition import Transition
+
+__all__ = [
+    "MixedTransitionsVersionsError",
+    "ReplayResult",
+    "UnknownTransitionError",
+    "replay",
+]
+
+
+class UnknownTransitionError(ValueError):
+    """The journal references a transition missing from the replayed transitions."""
+
+    def __init__(self, transition: int):
+        """Initialize new error for the unknown `transition`.
+
+        Args:
+            transition (int): The index of the unknown transition.
+        """
+        super().__init__(f"The journal references unknown transition {transition}.")
+
+
+class MixedTransitionsVersionsError(ValueError):
+    """The journal records decisions made with different versions of transitions."""
+
+    def __init__(self, versions: Iterable[int]):
+        """Initialize new error for the recorded `versions` of transitions.
+
+        Args:
+            versions (Iterable[int]): The recorded versions of transitions.
+        """
+        super().__init__(
+            "The journal records decisions made with transitions versions "
+            f"{', '.join(map(str, sorted(versions)))}; select one to replay."
+        )
+
+
+class ReplayResult(NamedTuple):
+    """The summary of a replayed journal."""
+
+    decisions: int
+    """The number of replayed navigation decisions."""
+
+    resyncs: int
+    """The number of times the replay had to restart from the recorded source screen."""
+
+    elapsed: float
+    """The time spent evaluating the decisions, in seconds.
+
+    Building the router, including rebuilding it for a restart, is not included."""
+
+
+class _StubScreen(ScreenBase):
+    __slots__ = ("_screen_name",)
+
+    @property
+    def screen_name(self) -> str:
+        return self._screen_name
+
+    def __init__(self, screen_name: str):
+        self._screen_name = screen_name
+
+    def will_present(self) -> None:
+        pass
+
+    def did_present(self) -> None:
+        pass
+
+    def will_disappear(self) -> None:
+        pass
+
+
+class _StubScreensFactory(ScreensFactoryBase[_StubScreen]):
+    __slots__ = ()
+
+    def create(self, screen_name: str) -> _StubScreen:
+        return _StubScreen(screen_name)
+
+
+class _NullPresenter:
+    __slots__ = ()
+
+    def present(self, screen: _StubScreen) -> None:
+        pass
+
+
+def replay(
+    path: str | os.PathLike[str],
+    transitions: Sequence[Transition[Any]],
+    transitions_version: int | None = None,
+) -> ReplayResult:
+    """Drive a router from the decisions recorded in the journal at `path`.
+
+    The router is built with stub screens, factory and presenter, and with copies
+    of `transitions` whose conditions select the recorded transition. The decisions
+    are replayed through `Router.on_state` as fast as possible, so the result can be
+    used as a realistic workload for profiling and throughput benchmarks.
+
+    The `transitions` must be the same transitions, in the same order, that the
+    recording router had at the replayed version of its transitions. Indices of
+    transitions change when transitions are removed, so decisions made with other
+    versions cannot be replayed together.
+
+    When the replayed router does not display the recorded source screen, for example
+    because the oldest records were overwritten, the replay restarts from that screen.
+
+    Args:
+        path (str | os.PathLike[str]): The path of the journal file.
+        transitions (Sequence[Transition[Any]]): The transitions of the recording router.
+        transitions_version (int | None): The version of transitions whose decisions
+            are replayed; decisions made with other versions are skipped. Defaults
+            to `None`, meaning all decisions must be made with the same version.
+
+    Returns:
+        The summary of the replay.
+
+    Raises:
+        MixedTransitionsVersionsError: The `transitions_version` is `None`,
+            and the journal records decisions made with different versions.
+        UnknownTransitionError: The journal references a transition missing
+            from `transitions`.
+    """
+    records = NavigationJournal.read(path)
+    if transitions_version is not None:
+        records = [
+            record
+            for record in records
+            if record.transitions_version == transitions_version
+        ]
+    elif len(versions := {record.transitions_version for record in records}) > 1:
+        raise MixedTransitionsVersionsError(versions)
+    if unknown := [r.transition for r in records if r.transition >= len(transitions)]:
+        raise UnknownTransitionError(unknown[0])
+
+    decisions = 0
+    resyncs = 0
+    elapsed = 0.0
+    router: Router[int, _StubScreen] | None = None
+    started_at = time.perf_counter()
+    for record in records:
+        source = transitions[record.transition].source
+        if router is None or router.current_screen.screen_name != source:
+            if router is not None:
+                elapsed += time.perf_counter() - started_at
+                resyncs += 1
+            router = _build_router(source, transitions)
+            started_at = time.perf_counter()
+        router.on_state(record.transition)
+        decisions += 1
+
+    if router is not None:
+        elapsed += time.perf_counter() - started_at
+    return ReplayResult(decisions=decisions, resyncs=resyncs, elapsed=elapsed)
+
+
+def _build_router(
+    initial_screen: str, transitions: Sequence[Transition[Any]]
+) -> Router[int, _StubScreen]:
+    router: Router[int, _StubScreen] = Router(
+        initial_screen=_StubScreen(initial_screen),
+        presenter=_NullPresenter(),
+        screens_factory=_StubScreensFactory(),
+    )
+    router.update_transitions(
+        add=[
+            Transition(
+                source=transition.source,
+                destination=transition.destination,
+                direction=transition.direction,
+                condition=partial(eq, index),
+            )
+            for index, transition in enumerate(transitions)
+        ]
+    )
+    return router
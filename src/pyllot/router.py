@@ -1,8 +1,22 @@
-from typing import Generic, TypeVar
+import asyncio
+import inspect
+import threading
+from collections.abc import Callable, Collection, Hashable, Iterable, Mapping
+from contextlib import suppress
+from typing import Any, Generic, TypeVar, cast
 
+from ._registry import _ScreenRegistry
 from ._stack import _NavigationStack
+from ._table import _Row, _TransitionTable
 from .abc import ScreenBase, ScreenPresenting, ScreensFactoryBase
+from .diagnostics import MemoryDiagnostics
 from .direction import TransitionDirection
+from .event_transition import EventTransition
+from .graph import RouteGraph
+from .journal import NavigationJournal
+from .memo import _EvaluationScope
+from .routes import CompiledRoutes, MissingPredicatesError
+from .snapshot import NavigationSnapshot
 from .transition import Transition
 
 TState = TypeVar("TState")
@@ -25,6 +39,21 @@ class Router(Generic[TState, TScreen]):
     Navigation is triggered whenever the application's state changes, and one of the
     registered transitions evaluates it's predicate as true.
 
+    Navigation can also be triggered by discrete events passed to `on_event`.
+    Event transitions are looked up by the current screen and the event key,
+    so dispatching an event does not evaluate predicates of unrelated transitions.
+
+    Transitions can be added and removed while the router is in use, also from other
+    threads. Every change publishes a new version of the transitions atomically,
+    and `on_state` evaluates a single version without locking, so an evaluation
+    in progress never observes a partially applied change.
+
+    Routers can be nested. A screen can own a child router with its own navigation
+    stack, for example for tabs, split panes or wizards. States and events that
+    do not trigger any transition of the parent are forwarded only to the child
+    of the currently displayed screen. Children of other screens keep their stacks,
+    but are not evaluated until their screen is displayed again.
+
     Tip:
         The `on_state(self, state: TState) -> None` signature matches
         the `pydepot.StoreSubscriber[TState]` from the
@@ -32,18 +61,52 @@ class Router(Generic[TState, TScreen]):
         Pyllot works great with the state managed by the `pydepot.Store`.
     """
 
-    __slots__ = ("_navigation_stack", "_screens_factory", "_transitions", "__weakref__")
+    __slots__ = (
+        "_children",
+        "_diagnostics",
+        "_event_transitions",
+        "_initial_screen_name",
+        "_journal",
+        "_lock",
+        "_navigation_stack",
+        "_registry",
+        "_screens_factory",
+        "_transitions",
+        "__weakref__",
+    )
 
     @property
     def current_screen(self) -> TScreen:
         """The currently displayed screen."""
         return self._navigation_stack.peek()
 
+    @property
+    def suspended_screens(self) -> tuple[TScreen, ...]:
+        """The screens covered by the current screen, from the bottom of the stack."""
+        return self._navigation_stack.suspended()
+
+    @property
+    def depth(self) -> int:
+        """The number of screens on the navigation stack."""
+        return len(self._navigation_stack)
+
+    @property
+    def transitions_version(self) -> int:
+        """The version of the transitions, incremented with every change."""
+        return self._transitions.version
+
+    @property
+    def active_child(self) -> "Router[TState, Any] | None":
+        """The child router owned by the currently displayed screen, if any."""
+        return self._children.get(self._navigation_stack.peek().screen_name)
+
     def __init__(
         self,
         initial_screen: TScreen,
         presenter: ScreenPresenting[TScreen],
         screens_factory: ScreensFactoryBase[TScreen],
+        journal: NavigationJournal | None = None,
+        diagnostics: MemoryDiagnostics | None = None,
     ):
         """Initialize new router with a initial screen, presenter and screens factory.
 
@@ -52,12 +115,28 @@ class Router(Generic[TState, TScreen]):
             presenter (ScreenPresenting[TScreen]): The presenter of the screens.
             screens_factory (ScreensFactoryBase[TScreen]): The screens factory for
                 creating screens at runtime.
+            journal (NavigationJournal | None): The optional journal recording every
+                transition performed by `on_state`. Defaults to `None`.
+            diagnostics (MemoryDiagnostics | None): The optional memory diagnostics
+                attributing allocations to screens. Defaults to `None`.
         """
+        self._registry: _ScreenRegistry = _ScreenRegistry()
+        self._initial_screen_name: str = initial_screen.screen_name
         self._navigation_stack: _NavigationStack[TScreen] = _NavigationStack(
-            presenter=presenter, initial_screen=initial_screen
+            presenter=presenter,
+            initial_screen=initial_screen,
+            registry=self._registry,
+            diagnostics=diagnostics,
         )
+        self._diagnostics: MemoryDiagnostics | None = diagnostics
         self._screens_factory: ScreensFactoryBase[TScreen] = screens_factory
-        self._transitions: list[Transition[TState]] = []
+        self._transitions: _TransitionTable[TState] = _TransitionTable(self._registry)
+        self._event_transitions: dict[
+            tuple[int, Hashable], tuple[EventTransition[Any], ...]
+        ] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self._children: dict[str, Router[TState, Any]] = {}
+        self._journal: NavigationJournal | None = journal
 
     def add_transition(self, transition: Transition[TState]) -> None:
         """Add a possible transition.
@@ -69,36 +148,339 @@ class Router(Generic[TState, TScreen]):
         Args:
             transition (Transition[TState]): The transition to add.
         """
-        self._transitions.append(transition)
+        self.update_transitions(add=(transition,))
+
+    def update_transitions(
+        self,
+        add: Iterable[Transition[TState]] = (),
+        remove: Iterable[Transition[TState]] = (),
+    ) -> int:
+        """Add and remove transitions in a single atomic change.
+
+        The change is applied to a copy of the transitions, which is then published
+        as a new version. Evaluations of `on_state` running concurrently keep
+        using the version they started with.
+
+        Args:
+            add (Iterable[Transition[TState]]): The transitions to add,
+                after all currently added ones. Defaults to none.
+            remove (Iterable[Transition[TState]]): The previously added transitions
+                to remove. Defaults to none.
+
+        Returns:
+            The new version of the transitions.
+        """
+        removed: Collection[_Row[TState]] = [_row(t) for t in remove]
+        added = [_row(t) for t in add]
+        with suppress(TypeError):
+            removed = set(removed)
+        with self._lock:
+            table = self._transitions
+            if removed:
+                table = table.without(
+                    {row for row, transition in enumerate(table) if transition in removed}
+                )
+            self._transitions = table.extended(added)
+            return self._transitions.version
+
+    def add_routes(
+        self,
+        routes: CompiledRoutes,
+        predicates: Mapping[str, Callable[[TState], bool]],
+    ) -> None:
+        """Add all transitions of declarative routes.
+
+        The transitions are added in the order of the route file, directly
+        from the compiled arrays, without creating `Transition` objects.
+
+        Args:
+            routes (CompiledRoutes): The compiled routes.
+            predicates (Mapping[str, Callable[[TState], bool]]): The predicates
+                referenced by the conditions of the routes, by their names.
+
+        Raises:
+            MissingPredicatesError: Some of the conditions are missing
+                from `predicates`.
+        """
+        if missing := [name for name in routes.conditions if name not in predicates]:
+            raise MissingPredicatesError(missing)
+
+        with self._lock:
+            self._transitions = self._transitions.extended(
+                (source, destination, direction, predicates[condition])
+                for source, destination, direction, condition in routes
+            )
+
+    def analyze(self, prune: bool = True) -> RouteGraph:
+        """Build the route graph of the transitions, and drop the dead ones.
+
+        The graph detects transitions that can never be performed, and answers
+        reachability and shortest path queries. With `prune` enabled, the dead
+        transitions are removed, so their predicates are never evaluated.
+        Removing transitions renumbers the remaining ones.
+
+        Screens pushed by event transitions count as reachable, but event
+        transitions themselves are never pruned.
+
+        Args:
+            prune (bool): Whether to remove the dead transitions. Defaults to true.
+
+        Returns:
+            The route graph of the transitions before pruning.
+        """
+        with self._lock:
+            graph = RouteGraph(
+                self._transitions,
+                self._initial_screen_name,
+                event_transitions=(
+                    (transition.source, transition.destination, transition.direction)
+                    for transitions in self._event_transitions.values()
+                    for transition in transitions
+                ),
+            )
+            if prune and graph.dead_transitions:
+                self._transitions = self._transitions.without(
+                    {dead.edge.position for dead in graph.dead_transitions}
+                )
+            return graph
+
+    def add_event_transition(self, transition: EventTransition[Any]) -> None:
+        """Add a possible transition triggered by an event.
+
+        When the `on_event` method is called with an event, only the transitions
+        registered for the current screen and the key of the event are evaluated
+        using `should_transition`. The first transition that evaluates to true
+        is performed.
+
+        Args:
+            transition (EventTransition[Any]): The event transition to add.
+        """
+        with self._lock:
+            key = (self._registry.intern(transition.source), transition.event)
+            event_transitions = self._event_transitions.copy()
+            event_transitions[key] = (*event_transitions.get(key, ()), transition)
+            self._event_transitions = event_transitions
+
+    def add_child(self, screen_name: str, router: "Router[TState, Any]") -> None:
+        """Attach a child router owned by the screen named `screen_name`.
+
+        The child router is evaluated only while the screen named `screen_name`
+        is displayed by this router. When the screen gets covered or popped,
+        the child keeps its navigation stack.
+
+        Args:
+            screen_name (str): The name of the screen owning the child router.
+            router (Router[TState, Any]): The child router.
+        """
+        self._children[screen_name] = router
+
+    def snapshot(self) -> NavigationSnapshot[TScreen]:
+        """Take an immutable snapshot of the navigation stack.
+
+        The snapshot shares the screens with the navigation stack instead of
+        copying them, so taking it does not depend on the depth of the stack.
+        Screens referenced by kept snapshots stay alive after being popped.
+
+        Returns:
+            The snapshot of the navigation stack.
+        """
+        return self._navigation_stack.snapshot()
 
     def on_state(self, state: TState) -> None:
         """Try to perform a transition given a new state.
 
         Finds all transitions that have the source equal to the current screen,
         and performs the first transition that evaluates the `should_transition` as true.
+        If there is no such transition, the state is forwarded to the active child.
+
+        Helpers decorated with `memoized` are computed at most once during
+        the evaluation, including the evaluation by the child.
 
         This method is best used as a subscriber callback to some state publisher.
 
         Args:
             state (TState): The new state.
         """
-        if transition := self._find_valid_transition(state):
-            match transition.direction:
-                case TransitionDirection.PUSH:
-                    self._navigation_stack.push(
-                        self._screens_factory.create(screen_name=transition.destination)
-                    )
-                case TransitionDirection.POP:
-                    self._navigation_stack.pop(destination=transition.destination)
-
-    def _find_valid_transition(self, state: TState) -> Transition[TState] | None:
-        current_screen_name: str = self._navigation_stack.peek().screen_name
+        with _EvaluationScope():
+            table = self._transitions
+            if (row := self._find_valid_transition(table, state)) is not None:
+                self._perform_row(table, row)
+            elif child := self.active_child:
+                child.on_state(state)
+
+    async def on_state_async(self, state: TState, timeout: float | None = None) -> None:
+        """Try to perform a transition given a new state, awaiting async predicates.
+
+        Works like `on_state`, but predicates may also be coroutine functions.
+        Predicates of all transitions from the current screen are evaluated
+        concurrently, so the latency of the evaluation is the latency of the slowest
+        needed predicate, rather than the sum of all of them.
+
+        The transition added first among the ones evaluating as true is performed.
+        Once a predicate evaluates as true, evaluations of transitions added after
+        it are cancelled.
+
+        Args:
+            state (TState): The new state.
+            timeout (float | None): The maximum time, in seconds, to await
+                a single predicate. Predicates that time out evaluate as false.
+                Defaults to `None`, meaning no timeout.
+        """
+        with _EvaluationScope():
+            table = self._transitions
+            row = await self._find_valid_transition_async(table, state, timeout)
+            if row is not None:
+                self._perform_row(table, row)
+            elif child := self.active_child:
+                await child.on_state_async(state, timeout=timeout)
+
+    def on_event(self, event: Any) -> None:
+        """Try to perform a transition given an event.
+
+        Looks up the transitions registered for the current screen and the event,
+        and performs the first one that evaluates the `should_transition` as true.
+
+        The event is matched first by its value (for example a string name
+        or an enum member), and then by its type. If there is no such transition,
+        the event is forwarded to the active child.
+
+        Args:
+            event (Any): The received event.
+        """
+        if transition := self._find_valid_event_transition(event):
+            self._perform(transition.direction, transition.destination)
+        elif child := self.active_child:
+            child.on_event(event)
+
+    def _perform_row(self, table: _TransitionTable[TState], row: int) -> None:
+        direction = table.direction(row)
+        self._perform(direction, table.destination(row))
+        if self._journal is not None:
+            self._journal.record(
+                transition=row,
+                transitions_version=table.version,
+                direction=direction,
+                depth=len(self._navigation_stack),
+            )
+
+    def _perform(self, direction: TransitionDirection, destination: str) -> None:
+        match direction:
+            case TransitionDirection.PUSH:
+                self._navigation_stack.push(self._create(destination))
+            case TransitionDirection.POP:
+                self._navigation_stack.pop(destination=destination)
+
+    def _create(self, screen_name: str) -> TScreen:
+        if self._diagnostics is None:
+            return self._screens_factory.create(screen_name=screen_name)
+
+        since = self._diagnostics.measure()
+        screen = self._screens_factory.create(screen_name=screen_name)
+        self._diagnostics.record(screen, since=since)
+        return screen
+
+    def _current_screen_id(self) -> int:
+        return self._registry.get(self._navigation_stack.peek().screen_name)
+
+    def _find_valid_transition(
+        self, table: _TransitionTable[TState], state: TState
+    ) -> int | None:
+        return next(
+            (
+                row
+                for row in table.rows(self._current_screen_id())
+                if table.predicate(row)(state)
+            ),
+            None,
+        )
+
+    async def _find_valid_transition_async(
+        self, table: _TransitionTable[TState], state: TState, timeout: float | None
+    ) -> int | None:
+        rows = table.rows(self._current_screen_id())
+        tasks = [
+            asyncio.ensure_future(_evaluate(table.predicate(row), state, timeout))
+            for row in rows
+        ]
+        try:
+            pending = set(tasks)
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for row, task in zip(rows, tasks, strict=True):
+                    if not task.done():
+                        break
+                    if task.result():
+                        return row
+
+                # Rows after the first true one can never be performed, so their
+                # failures are irrelevant, like in `on_state`, which never
+                # evaluates them.
+                winner = next(
+                    (index for index, task in enumerate(tasks) if _is_true(task)), None
+                )
+                if winner is not None:
+                    for task in tasks[winner + 1 :]:
+                        task.cancel()
+                    pending = {task for task in tasks[:winner] if not task.done()}
+            return None
+        finally:
+            for task in tasks:
+                if not task.cancel() and not task.cancelled():
+                    # Retrieve the exception, so that irrelevant failures
+                    # are not reported as never retrieved.
+                    task.exception()
+
+    def _find_valid_event_transition(self, event: Any) -> EventTransition[Any] | None:
+        current_screen_id = self._current_screen_id()
+        transitions = self._event_transitions
         return next(
             (
                 transition
-                for transition in self._transitions
-                if transition.source == current_screen_name
-                and transition.should_transition(state)
+                for key in self._event_keys(event)
+                for transition in transitions.get((current_screen_id, key), ())
+                if transition.should_transition(event)
             ),
             None,
         )
+
+    @staticmethod
+    def _event_keys(event: Any) -> tuple[Hashable, ...]:
+        # Classes are hashable, although mypy does not match them with `Hashable`.
+        event_type = cast(Hashable, event if isinstance(event, type) else type(event))
+        if isinstance(event, type) or not isinstance(event, Hashable):
+            return (event_type,)
+        return (event, event_type)
+
+
+def _row(transition: Transition[TState]) -> _Row[TState]:
+    # Subclasses overriding `should_transition` are evaluated through the override.
+    predicate = (
+        transition.condition
+        if getattr(type(transition), "should_transition", None)
+        is Transition.should_transition
+        else transition.should_transition
+    )
+    return (transition.source, transition.destination, transition.direction, predicate)
+
+
+def _is_true(task: "asyncio.Future[bool]") -> bool:
+    return (
+        task.done()
+        and not task.cancelled()
+        and task.exception() is None
+        and task.result()
+    )
+
+
+async def _evaluate(
+    predicate: Callable[[Any], Any], state: Any, timeout: float | None
+) -> bool:
+    result = predicate(state)
+    if not inspect.isawaitable(result):
+        return bool(result)
+    try:
+        return bool(await asyncio.wait_for(result, timeout))
+    except asyncio.TimeoutError:
+        return False
@@ -0,0 +1,374 @@
+import hashlib
+import json
+import marshal
+import os
+import pathlib
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import suppress
+from typing import Any
+
+from .direction import TransitionDirection
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # pragma: no cover
+    tomllib = None  # type: ignore[assignment]
+
+__all__ = [
+    "CompiledRoutes",
+    "IncompatibleArtifactError",
+    "InvalidRoutesError",
+    "MissingPredicatesError",
+]
+
+_FORMAT = b"PYLR1"
+_ARTIFACT_FIELDS = 7
+_CACHE_SUFFIX = ".pyllotc"
+
+
+class InvalidRoutesError(ValueError):
+    """The route file is malformed, or the route graph is invalid."""
+
+    @property
+    def name(self) -> str:
+        """The name of the route file."""
+        return self._name
+
+    @property
+    def reason(self) -> str:
+        """The description of the problem."""
+        return self._reason
+
+    def __init__(self, name: str, reason: str):
+        """Initialize new error for the route file named `name`.
+
+        Args:
+            name (str): The name of the route file.
+            reason (str): The description of the problem.
+        """
+        super().__init__(f"{name}: {reason}")
+        self._name: str = name
+        self._reason: str = reason
+
+
+class IncompatibleArtifactError(ValueError):
+    """The data is not a compatible compiled routes artifact."""
+
+    def __init__(self) -> None:
+        """Initialize new error."""
+        super().__init__("Incompatible routes artifact.")
+
+
+class MissingPredicatesError(ValueError):
+    """Predicates referenced by conditions of routes are missing."""
+
+    @property
+    def conditions(self) -> tuple[str, ...]:
+        """The names of conditions without a predicate."""
+        return self._conditions
+
+    def __init__(self, conditions: Iterable[str]):
+        """Initialize new error for the `conditions` without a predicate.
+
+        Args:
+            conditions (Iterable[str]): The names of conditions without a predicate.
+        """
+        self._conditions: tuple[str, ...] = tuple(conditions)
+        super().__init__(
+            f"Missing predicates for conditions: {', '.join(self._conditions)}."
+        )
+
+
+class CompiledRoutes:
+    """The validated transitions of a declarative route file.
+
+    A route file lists transitions in TOML or JSON. Each condition is the name
+    of a predicate registered when the routes are added to a router, for example:
+
+    ```toml
+    [[transitions]]
+    source = "home"
+    destination = "video_player"
+    direction = "push"
+    condition = "has_current_video"
+    ```
+
+    Compiled routes are stored as compact arrays of screen and condition indices,
+    and can be cached on disk. The cache is keyed by the hash of the route file,
+    so later launches load the arrays directly instead of parsing and validating
+    the file again.
+
+    Example:
+        ```python3
+        routes = CompiledRoutes.load("routes.toml", cache_dir=".cache")
+        router.add_routes(routes, predicates={"has_current_video": has_current_video})
+        ```
+    """
+
+    __slots__ = (
+        "_conditions",
+        "_destinations",
+        "_directions",
+        "_condition_indices",
+        "_screens",
+        "_sources",
+    )
+
+    @property
+    def screens(self) -> tuple[str, ...]:
+        """The names of all screens referenced by the routes."""
+        return self._screens
+
+    @property
+    def conditions(self) -> tuple[str, ...]:
+        """The names of all predicates referenced by the routes."""
+        return self._conditions
+
+    def __init__(
+        self,
+        screens: tuple[str, ...],
+        conditions: tuple[str, ...],
+        sources: "array[int]",
+        destinations: "array[int]",
+        directions: "array[int]",
+        condition_indices: "array[int]",
+    ):
+        """Initialize new routes from already validated arrays.
+
+        Use `compile` or `load` instead of calling the initializer directly.
+        """
+        self._screens: tuple[str, ...] = screens
+        self._conditions: tuple[str, ...] = conditions
+        self._sources: array[int] = sources
+        self._destinations: array[int] = destinations
+        self._directions: array[int] = directions
+        self._condition_indices: array[int] = condition_indices
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __iter__(self) -> Iterator[tuple[str, str, TransitionDirection, str]]:
+        """Iterate over the transitions in the order of the route file.
+
+        Yields:
+            The source, destination, direction and condition name of a transition.
+        """
+        screens, conditions = self._screens, self._conditions
+        for source, destination, direction, condition in zip(
+            self._sources,
+            self._destinations,
+            self._directions,
+            self._condition_indices,
+            strict=True,
+        ):
+            yield (
+                screens[source],
+                screens[destination],
+                TransitionDirection(direction),
+                conditions[condition],
+            )
+
+    @classmethod
+    def compile(cls, path: str | os.PathLike[str]) -> "CompiledRoutes":
+        """Parse and validate the route file at `path`.
+
+        Files with the `.toml` suffix are parsed as TOML, other files as JSON.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the route file.
+
+        Returns:
+            The compiled routes.
+
+        Raises:
+            InvalidRoutesError: The route file is malformed, or the route graph
+                is invalid.
+        """
+        path = pathlib.Path(path)
+        return cls._compile(_parse(path.suffix, path.read_bytes(), str(path)), str(path))
+
+    @classmethod
+    def load(
+        cls,
+        path: str | os.PathLike[str],
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> "CompiledRoutes":
+        """Load the routes from the file at `path`, using the on-disk cache if possible.
+
+        When `cache_dir` is given and contains an artifact matching the content
+        of the route file, the artifact is loaded without parsing the file.
+        Otherwise the file is compiled, and the artifact is written to `cache_dir`.
+        Failing to write the artifact is ignored, so the cache never prevents
+        loading the routes.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the route file.
+            cache_dir (str | os.PathLike[str] | None): The directory of cached
+                artifacts. Defaults to `None`, meaning no caching.
+
+        Returns:
+            The compiled routes.
+
+        Raises:
+            InvalidRoutesError: The route file is malformed, or the route graph
+                is invalid.
+        """
+        path = pathlib.Path(path)
+        content = path.read_bytes()
+        if cache_dir is None:
+            return cls._compile(_parse(path.suffix, content, str(path)), str(path))
+
+        digest = hashlib.sha256(_FORMAT + path.suffix.encode() + content).hexdigest()
+        artifact = pathlib.Path(cache_dir) / f"{path.stem}-{digest[:32]}{_CACHE_SUFFIX}"
+        try:
+            return cls.loads(artifact.read_bytes())
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+
+        routes = cls._compile(_parse(path.suffix, content, str(path)), str(path))
+        _write_artifact(artifact, routes.dumps())
+        return routes
+
+    def dumps(self) -> bytes:
+        """Serialize the routes to the binary artifact format.
+
+        Returns:
+            The serialized routes.
+        """
+        return marshal.dumps(
+            (
+                _FORMAT,
+                self._screens,
+                self._conditions,
+                self._sources.tobytes(),
+                self._destinations.tobytes(),
+                self._directions.tobytes(),
+                self._condition_indices.tobytes(),
+            )
+        )
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CompiledRoutes":
+        """Deserialize the routes from the binary artifact format.
+
+        Args:
+            data (bytes): The serialized routes.
+
+        Returns:
+            The deserialized routes.
+
+        Raises:
+            IncompatibleArtifactError: The data is not a compatible artifact.
+        """
+        fields = marshal.loads(data)
+        if (
+            not isinstance(fields, tuple)
+            or len(fields) != _ARTIFACT_FIELDS
+            or fields[0] != _FORMAT
+        ):
+            raise IncompatibleArtifactError
+
+        _, screens, conditions, sources, destinations, directions, indices = fields
+        return cls(
+            screens=screens,
+            conditions=conditions,
+            sources=array("i", sources),
+            destinations=array("i", destinations),
+            directions=array("b", directions),
+            condition_indices=array("i", indices),
+        )
+
+    @classmethod
+    def _compile(cls, document: Any, name: str) -> "CompiledRoutes":
+        entries = document.get("transitions") if isinstance(document, dict) else None
+        if not isinstance(entries, list):
+            raise InvalidRoutesError(name, "expected a list of transitions.")
+
+        screens: dict[str, int] = {}
+        conditions: dict[str, int] = {}
+        transitions: dict[tuple[str, str, TransitionDirection, str], int] = {}
+        for index, entry in enumerate(entries):
+            transition = _validate(entry, index, name)
+            if (duplicated := transitions.get(transition)) is not None:
+                raise InvalidRoutesError(
+                    name, f"transition {index} duplicates transition {duplicated}."
+                )
+            transitions[transition] = index
+
+        pushing = {
+            source
+            for source, _, direction, _ in transitions
+            if direction == TransitionDirection.PUSH
+        }
+        for source, destination, direction, _ in transitions:
+            if direction == TransitionDirection.POP and destination not in pushing:
+                raise InvalidRoutesError(
+                    name,
+                    f"{source!r} pops to {destination!r}, which never pushes a screen, "
+                    "so it can never be on the stack below another screen.",
+                )
+
+        sources, destinations = array("i"), array("i")
+        directions, condition_indices = array("b"), array("i")
+        for source, destination, direction, condition in transitions:
+            sources.append(screens.setdefault(source, len(screens)))
+            destinations.append(screens.setdefault(destination, len(screens)))
+            directions.append(direction.value)
+            condition_indices.append(conditions.setdefault(condition, len(conditions)))
+
+        return cls(
+            screens=tuple(screens),
+            conditions=tuple(conditions),
+            sources=sources,
+            destinations=destinations,
+            directions=directions,
+            condition_indices=condition_indices,
+        )
+
+
+def _write_artifact(artifact: pathlib.Path, data: bytes) -> None:
+    temporary = artifact.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_bytes(data)
+        os.replace(temporary, artifact)
+    except OSError:
+        with suppress(OSError):
+            temporary.unlink(missing_ok=True)
+
+
+def _parse(suffix: str, content: bytes, name: str) -> Any:
+    if suffix == ".toml":
+        if tomllib is None:  # pragma: no cover
+            raise InvalidRoutesError(name, "TOML route files require Python 3.11.")
+        try:
+            return tomllib.loads(content.decode())
+        except tomllib.TOMLDecodeError as error:
+            raise InvalidRoutesError(name, str(error)) from error
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as error:
+        raise InvalidRoutesError(name, str(error)) from error
+
+
+def _validate(
+    entry: Any, index: int, name: str
+) -> tuple[str, str, TransitionDirection, str]:
+    if not isinstance(entry, Mapping):
+        raise InvalidRoutesError(name, f"transition {index} is not a table.")
+
+    fields = []
+    for key in ("source", "destination", "direction", "condition"):
+        value = entry.get(key)
+        if not isinstance(value, str) or not value:
+            raise InvalidRoutesError(name, f"transition {index} is missing {key!r}.")
+        fields.append(value)
+
+    source, destination, direction, condition = fields
+    try:
+        return source, destination, TransitionDirection[direction.upper()], condition
+    except KeyError:
+        raise InvalidRoutesError(
+            name, f"transition {index} has unknown direction {direction!r}."
+        ) from None
@@ -0,0 +1,75 @@
+import threading
+import weakref
+from typing import TypeVar
+
+from .abc import ScreenBase, ScreensFactoryBase
+
+TScreen = TypeVar("TScreen", bound=ScreenBase, covariant=True)
+"""Covariant type variable bound by `ScreenBase`."""
+
+__all__ = ["SharedScreensFactory"]
+
+_shared_screens: "weakref.WeakValueDictionary[str, ScreenBase]" = (
+    weakref.WeakValueDictionary()
+)
+_shared_screens_lock = threading.Lock()
+
+
+class SharedScreensFactory(ScreensFactoryBase[TScreen]):
+    """Factory reusing instances of shareable screens.
+
+    Wraps another factory, and for screens that declare themselves `shareable`,
+    hands out a single instance per screen name to all routers in the process,
+    and to every position in their navigation stacks. Other screens are created
+    by the wrapped factory every time.
+
+    Shared instances are cached weakly, so a shared screen is released once
+    no navigation stack holds it anymore.
+
+    Example:
+        ```python3
+        class HelpScreen(MyScreen):
+            shareable = True
+
+            @property
+            def screen_name(self) -> str:
+                return "help"
+
+
+        factory = SharedScreensFactory(MyScreensFactory())
+        ```
+    """
+
+    __slots__ = ("_factory",)
+
+    def __init__(self, factory: ScreensFactoryBase[TScreen]):
+        """Initialize new factory wrapping the `factory`.
+
+        Args:
+            factory (ScreensFactoryBase[TScreen]): The factory creating the screens.
+        """
+        self._factory: ScreensFactoryBase[TScreen] = factory
+
+    def create(self, screen_name: str) -> TScreen:
+        """Get the shared screen named `screen_name`, or create new one.
+
+        Args:
+            screen_name (str): The name of the screen to create.
+
+        Returns:
+            TScreen: The shared or created screen.
+        """
+        if (screen := _shared_screens.get(screen_name)) is not None:
+            return screen  # type: ignore[return-value]
+
+        screen = self._factory.create(screen_name=screen_name)
+        if not screen.shareable:
+            return screen
+
+        with _shared_screens_lock:
+            try:
+                return _shared_screens.setdefault(  # type: ignore[return-value]
+                    screen_name, screen
+                )
+            except TypeError:
+                return screen
@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+
+from .abc import ScreenBase
+
+_TScreen = TypeVar("_TScreen", bound=ScreenBase)
+"""Type variable bound by `ScreenBase`."""
+
+__all__ = ["NavigationSnapshot"]
+
+
+class _StackNode(Generic[_TScreen]):
+    """An immutable node of the navigation stack, linked to the node below it."""
+
+    __slots__ = ("depth", "parent", "screen", "screen_id")
+
+    def __init__(
+        self, screen: _TScreen, screen_id: int, parent: "_StackNode[_TScreen] | None"
+    ):
+        """Initialize new node on top of the `parent` node.
+
+        Args:
+            screen (_TScreen): The screen at this position of the stack.
+            screen_id (int): The interned id of the screen name.
+            parent (_StackNode[_TScreen] | None): The node below this one,
+                or `None` at the bottom of the stack.
+        """
+        self.screen: _TScreen = screen
+        self.screen_id: int = screen_id
+        self.parent: _StackNode[_TScreen] | None = parent
+        self.depth: int = parent.depth + 1 if parent is not None else 1
+
+
+class NavigationSnapshot(Generic[_TScreen]):
+    """An immutable snapshot of the navigation stack.
+
+    Nodes of the navigation stack are never modified, and pushing or popping
+    screens only moves the top of the stack, so a snapshot shares the nodes
+    with the stack instead of copying them. Taking a snapshot costs the same
+    regardless of the depth of the stack, which makes it cheap enough to take
+    on every navigation, for example for undo or crash reports.
+
+    Use `Router.snapshot` to take a snapshot of a router.
+    """
+
+    __slots__ = ("_top",)
+
+    @property
+    def current_screen(self) -> _TScreen:
+        """The screen on top of the stack at the time of the snapshot."""
+        return self._top.screen
+
+    @property
+    def screens(self) -> tuple[_TScreen, ...]:
+        """The screens on the stack, from the bottom of the stack."""
+        return tuple(self)
+
+    def __init__(self, top: _StackNode[_TScreen]):
+        """Initialize new snapshot of the stack ending with the `top` node.
+
+        Args:
+            top (_StackNode[_TScreen]): The node on top of the stack.
+        """
+        self._top: _StackNode[_TScreen] = top
+
+    def __len__(self) -> int:
+        return self._top.depth
+
+    def __iter__(self) -> Iterator[_TScreen]:
+        """Iterate over the screens on the stack.
+
+        Yields:
+            The screens, from the bottom of the stack.
+        """
+        screens: list[_TScreen] = []
+        node: _StackNode[_TScreen] | None = self._top
+        while node is not None:
+            screens.append(node.screen)
+            node = node.parent
+        yield from reversed(screens)
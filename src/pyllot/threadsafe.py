@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from abc import abstractmethod
+from collections.abc import Callable
+from typing import Any, Generic, Protocol, TypeVar
+
+from .router import Router
+
+TState = TypeVar("TState")
+"""Invariant type variable for a generic state."""
+
+__all__ = [
+    "AsyncioScheduler",
+    "ThreadSafeRouter",
+    "TkinterScheduler",
+    "UIScheduling",
+]
+
+
+class UIScheduling(Protocol):
+    """Schedules callbacks to run on the UI thread.
+
+    Any object implementing the `schedule(callback: Callable[[], None]) -> None`
+    method, which is safe to call from any thread, is a valid scheduler.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def schedule(self, callback: Callable[[], None]) -> None:
+        """Schedule the `callback` to run on the UI thread.
+
+        Args:
+            callback (Callable[[], None]): The callback to run.
+        """
+
+
+class AsyncioScheduler:
+    """Schedules callbacks on an `asyncio` event loop running the UI."""
+
+    __slots__ = ("_loop",)
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """Initialize new scheduler with the UI event loop.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop running on the UI thread.
+        """
+        self._loop: asyncio.AbstractEventLoop = loop
+
+    def schedule(self, callback: Callable[[], None]) -> None:
+        """Schedule the `callback` to run on the event loop.
+
+        Args:
+            callback (Callable[[], None]): The callback to run.
+        """
+        self._loop.call_soon_threadsafe(callback)
+
+
+class TkinterScheduler:
+    """Schedules callbacks on the `tkinter` main loop.
+
+    Tk widgets must not be touched from other threads, so instead of calling
+    `after` from the calling thread, the scheduler polls for scheduled callbacks
+    with an `after` callback registered on the UI thread. A callback that raises
+    does not stop the polling, and the callbacks scheduled after it run
+    on the next poll.
+
+    The scheduler has to be created on the UI thread.
+    """
+
+    __slots__ = ("_callbacks", "_interval", "_lock", "_widget")
+
+    def __init__(self, widget: Any, interval: int = 16):
+        """Initialize new scheduler and start polling.
+
+        Args:
+            widget (Any): Any `tkinter` widget, typically the root `Tk` object.
+            interval (int): The polling interval, in milliseconds. Defaults to 16.
+        """
+        self._widget: Any = widget
+        self._interval: int = interval
+        self._lock: threading.Lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self._widget.after(self._interval, self._poll)
+
+    def schedule(self, callback: Callable[[], None]) -> None:
+        """Schedule the `callback` to run on the next poll of the main loop.
+
+        Args:
+            callback (Callable[[], None]): The callback to run.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def _poll(self) -> None:
+        with self._lock:
+            pending, self._callbacks = iter(self._callbacks), []
+        try:
+            for callback in pending:
+                callback()
+        finally:
+            # When a callback raises, the remaining ones run on the next poll.
+            with self._lock:
+                self._callbacks[:0] = pending
+            self._widget.after(self._interval, self._poll)
+
+
+class ThreadSafeRouter(Generic[TState]):
+    """Thread-safe front end of a router.
+
+    The `on_state` method can be called from any thread. Instead of evaluating
+    the state right away, the front end stores it as pending and schedules
+    a single evaluation on the UI thread. States arriving before that evaluation
+    replace the pending one, so only the latest state is passed to the router,
+    and the router evaluates at most once per scheduled callback, regardless
+    of how many states arrived in the meantime.
+
+    Example:
+        ```python3
+        loop = asyncio.get_running_loop()
+        front = ThreadSafeRouter(router=router, scheduler=AsyncioScheduler(loop))
+        store.subscribe(front)
+        ```
+    """
+
+    __slots__ = ("_has_pending", "_lock", "_pending", "_router", "_scheduler")
+
+    def __init__(self, router: Router[TState, Any], scheduler: UIScheduling):
+        """Initialize new front end of the `router`.
+
+        Args:
+            router (Router[TState, Any]): The router evaluating the states.
+            scheduler (UIScheduling): The scheduler of the UI thread.
+        """
+        self._router: Router[TState, Any] = router
+        self._scheduler: UIScheduling = scheduler
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: TState | None = None
+        self._has_pending: bool = False
+
+    def on_state(self, state: TState) -> None:
+        """Schedule evaluation of the `state` on the UI thread.
+
+        If an evaluation is already scheduled, the `state` replaces the pending one.
+
+        Args:
+            state (TState): The new state.
+        """
+        with self._lock:
+            self._pending = state
+            if self._has_pending:
+                return
+            self._has_pending = True
+        self._scheduler.schedule(self._flush)
+
+    def _flush(self) -> None:
+        with self._lock:
+            state, self._pending = self._pending, None
+            self._has_pending = False
+        self._router.on_state(state)  # type: ignore[arg-type]
@@ -0,0 +1,190 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Generic, TypeVar
+
+from .router import Router
+
+TState = TypeVar("TState")
+"""Invariant type variable for a generic state."""
+
+__all__ = ["Debouncer", "InvalidEdgesError", "Throttler"]
+
+
+class InvalidEdgesError(ValueError):
+    """Neither the leading nor the trailing edge of a window is enabled."""
+
+    def __init__(self) -> None:
+        """Initialize new error."""
+        super().__init__("At least one of leading and trailing must be true.")
+
+
+class _RateLimiter(Generic[TState], ABC):
+    __slots__ = (
+        "_handle",
+        "_has_pending",
+        "_leading",
+        "_loop",
+        "_pending",
+        "_router",
+        "_source",
+        "_trailing",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        router: Router[TState, Any],
+        window: float,
+        leading: bool = False,
+        trailing: bool = True,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        """Initialize new wrapper of the `router`.
+
+        Args:
+            router (Router[TState, Any]): The router evaluating the states.
+            window (float): The length of the window, in seconds.
+            leading (bool): Whether to evaluate the first state of a window
+                immediately. Defaults to false.
+            trailing (bool): Whether to evaluate the latest state received during
+                a window when the window ends. Defaults to true.
+            loop (asyncio.AbstractEventLoop | None): The event loop scheduling
+                the windows. Defaults to `None`, meaning the running loop.
+
+        Raises:
+            InvalidEdgesError: Both `leading` and `trailing` are false.
+        """
+        if not (leading or trailing):
+            raise InvalidEdgesError
+
+        self._router: Router[TState, Any] = router
+        self._window: float = window
+        self._leading: bool = leading
+        self._trailing: bool = trailing
+        self._loop: asyncio.AbstractEventLoop | None = loop
+        self._handle: asyncio.TimerHandle | None = None
+        self._source: str | None = None
+        self._pending: TState | None = None
+        self._has_pending: bool = False
+
+    def cancel(self) -> None:
+        """Cancel the current window, dropping the pending state."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending = None
+        self._has_pending = False
+
+    def _enter(self, state: TState) -> bool:
+        source = self._router.current_screen.screen_name
+        if source != self._source:
+            self.cancel()
+            self._source = source
+
+        if self._handle is not None:
+            self._pending = state
+            self._has_pending = True
+            return False
+
+        if self._leading:
+            self._router.on_state(state)
+        else:
+            self._pending = state
+            self._has_pending = True
+        return True
+
+    def _schedule(self) -> None:
+        loop = self._loop or asyncio.get_running_loop()
+        self._handle = loop.call_later(self._window, self._on_window_end)
+
+    def _flush(self) -> bool:
+        self._handle = None
+        if not (self._trailing and self._has_pending):
+            return False
+
+        state = self._pending
+        self._pending = None
+        self._has_pending = False
+        self._router.on_state(state)  # type: ignore[arg-type]
+        return True
+
+    @abstractmethod
+    def _on_window_end(self) -> None:
+        """Handle the end of the current window."""
+
+
+class Debouncer(_RateLimiter[TState]):
+    """Debounces the states passed to a router on `asyncio`.
+
+    The router evaluates a state only once the states stop changing for
+    the length of the `window`. With `leading` enabled, the first state is
+    evaluated immediately, and with `trailing` enabled, the latest state is
+    evaluated once the window ends.
+
+    Windows are tracked per source screen: when the current screen of the router
+    changes, the window is reset, and the pending state is dropped.
+
+    The `on_state(self, state: TState) -> None` signature matches
+    the `pydepot.StoreSubscriber[TState]`, so a debouncer can replace the router
+    in store subscriptions.
+
+    Example:
+        ```python3
+        store.subscribe(Debouncer(router, window=0.3))
+        ```
+    """
+
+    __slots__ = ()
+
+    def on_state(self, state: TState) -> None:
+        """Evaluate the `state` according to the debouncing policy.
+
+        Every call restarts the current window.
+
+        Args:
+            state (TState): The new state.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+        self._enter(state)
+        self._schedule()
+
+    def _on_window_end(self) -> None:
+        self._flush()
+
+
+class Throttler(_RateLimiter[TState]):
+    """Throttles the states passed to a router on `asyncio`.
+
+    The router evaluates at most one state per `window`. With `leading` enabled,
+    the first state of a window is evaluated immediately, and with `trailing`
+    enabled, the latest state received during the window is evaluated once
+    the window ends, starting the next window.
+
+    Windows are tracked per source screen: when the current screen of the router
+    changes, the window is reset, and the pending state is dropped.
+
+    The `on_state(self, state: TState) -> None` signature matches
+    the `pydepot.StoreSubscriber[TState]`, so a throttler can replace the router
+    in store subscriptions.
+
+    Example:
+        ```python3
+        store.subscribe(Throttler(router, window=0.1, leading=True))
+        ```
+    """
+
+    __slots__ = ()
+
+    def on_state(self, state: TState) -> None:
+        """Evaluate the `state` according to the throttling policy.
+
+        Args:
+            state (TState): The new state.
+        """
+        if self._enter(state):
+            self._schedule()
+
+    def _on_window_end(self) -> None:
+        if self._flush():
+            self._schedule()
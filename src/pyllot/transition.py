@@ -6,7 +6,22 @@ from .direction import TransitionDirection
 TState = TypeVar("TState")
 """Invariant type variable for a generic state."""
 
-__all__ = ["Transition"]
+__all__ = ["Transition", "always"]
+
+
+def always(state: object) -> bool:
+    """Predicate of an unconditional transition, evaluating as true for any state.
+
+    Using this predicate instead of an equivalent lambda lets the route graph
+    analysis recognize the transition as unconditional.
+
+    Args:
+        state (object): The state to evaluate.
+
+    Returns:
+        Always true.
+    """
+    return True
 
 
 class Transition(Generic[TState]):
@@ -35,6 +50,11 @@ class Transition(Generic[TState]):
         """The direction of the transition."""
         return self._direction
 
+    @property
+    def condition(self) -> Callable[[TState], bool]:
+        """The predicate for this transition."""
+        return self._condition
+
     _source: str
     _destination: str
     _direction: TransitionDirection
@@ -0,0 +1,147 @@
+import json
+
+import pytest
+
+from src.pyllot import (
+    MemoryDiagnostics,
+    Router,
+    ScreenBase,
+    ScreensFactoryBase,
+    Transition,
+    TransitionDirection,
+)
+
+PAYLOAD_SIZE = 200_000
+
+
+class Screen(ScreenBase):
+    def __init__(self, name: str):
+        self._name = name
+        self.payload = bytearray(PAYLOAD_SIZE)
+        self.presented: list[bytearray] = []
+
+    @property
+    def screen_name(self) -> str:
+        return self._name
+
+    def will_present(self) -> None:
+        self.presented.append(bytearray(PAYLOAD_SIZE))
+
+    def did_present(self) -> None:
+        pass
+
+    def will_disappear(self) -> None:
+        pass
+
+
+class Factory(ScreensFactoryBase[Screen]):
+    def __init__(self):
+        self.created: list[Screen] = []
+
+    def create(self, screen_name: str) -> Screen:
+        screen = Screen(screen_name)
+        self.created.append(screen)
+        return screen
+
+
+class NullPresenter:
+    def present(self, screen: Screen) -> None:
+        pass
+
+
+@pytest.fixture()
+def diagnostics():
+    diagnostics = MemoryDiagnostics()
+    yield diagnostics
+    diagnostics.stop()
+
+
+@pytest.fixture()
+def factory() -> Factory:
+    return Factory()
+
+
+@pytest.fixture()
+def router(diagnostics, factory) -> Router:
+    router: Router[str, Screen] = Router(
+        initial_screen=Screen("home"),
+        presenter=NullPresenter(),
+        screens_factory=factory,
+        diagnostics=diagnostics,
+    )
+    router.add_transition(
+        Transition("home", "player", TransitionDirection.PUSH, lambda s: s == "play")
+    )
+    router.add_transition(
+        Transition("player", "home", TransitionDirection.POP, lambda s: s == "stop")
+    )
+    return router
+
+
+class TestMemoryDiagnostics:
+    def test_report__attributes_allocations_to_created_and_presented_screen(
+        self, diagnostics, router, factory
+    ):
+        router.on_state("play")
+
+        report = diagnostics.report()
+
+        assert report.allocated["player"] >= 2 * PAYLOAD_SIZE
+        assert [screen.screen_name for screen in report.live] == ["home", "player"]
+        assert report.live[1].retained >= 2 * PAYLOAD_SIZE
+
+    def test_report__when_popped_screen_is_freed__does_not_report_it(
+        self, diagnostics, router, factory
+    ):
+        router.on_state("play")
+        router.on_state("stop")
+        factory.created.clear()
+
+        report = diagnostics.report()
+
+        assert report.leaked == ()
+        assert [screen.screen_name for screen in report.live] == ["home"]
+
+    def test_report__when_popped_screen_is_still_alive__reports_it_as_leaked(
+        self, diagnostics, router, factory
+    ):
+        router.on_state("play")
+        router.on_state("stop")
+
+        report = diagnostics.report()
+
+        assert [screen.screen_name for screen in report.leaked] == ["player"]
+        assert report.leaked[0].retained >= 2 * PAYLOAD_SIZE
+
+    def test_did_pop__when_popped_screen_is_freed__stops_watching_it(self, diagnostics):
+        screen = Screen("player")
+        diagnostics.record(screen, since=diagnostics.measure())
+        diagnostics.did_pop([screen])
+
+        del screen
+
+        assert diagnostics._popped == {}
+
+    def test_did_pop__when_shared_screen_remains_on_stack__keeps_it_live(
+        self, diagnostics
+    ):
+        screen = Screen("player")
+        diagnostics.record(screen, since=diagnostics.measure())
+
+        diagnostics.did_pop([screen], remaining=[Screen("home"), screen])
+        report = diagnostics.report()
+
+        assert report.leaked == ()
+        assert [screen.screen_name for screen in report.live] == ["player"]
+
+    def test_dump__writes_report_as_json(self, diagnostics, router, tmp_path):
+        router.on_state("play")
+        path = tmp_path / "memory.json"
+
+        diagnostics.dump(path)
+
+        content = json.loads(path.read_text())
+        assert [screen["screen_name"] for screen in content["live"]] == [
+            "home",
+            "player",
+        ]
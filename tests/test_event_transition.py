@@ -0,0 +1,53 @@
+from unittest.mock import Mock
+
+from src.pyllot import EventTransition, TransitionDirection
+
+
+class TestEventTransition:
+    def test_event__returns_value_passed_to_init(self):
+        sut = EventTransition(
+            source="foo",
+            destination="bar",
+            direction=TransitionDirection.PUSH,
+            event="pressed",
+        )
+        assert sut.event == "pressed"
+
+    def test_should_transition__when_no_guard__returns_true(self):
+        sut = EventTransition(
+            source="foo",
+            destination="bar",
+            direction=TransitionDirection.PUSH,
+            event="pressed",
+        )
+
+        assert sut.should_transition(Mock())
+
+    def test_should_transition__returns_result_of_guard_passed_to_init(self):
+        guard = Mock(return_value=False)
+        sut = EventTransition(
+            source="foo",
+            destination="bar",
+            direction=TransitionDirection.PUSH,
+            event="pressed",
+            guard=guard,
+        )
+
+        result = sut.should_transition(Mock())
+
+        assert not result
+
+    def test_should_transition__calls_guard_with_event_param(self):
+        event = Mock()
+        guard = Mock()
+        sut = EventTransition(
+            source="foo",
+            destination="bar",
+            direction=TransitionDirection.POP,
+            event="pressed",
+            guard=guard,
+        )
+
+        sut.should_transition(event=event)
+
+        guard.assert_called_once_with(event)
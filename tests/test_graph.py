@@ -0,0 +1,102 @@
+from unittest.mock import Mock
+
+from src.pyllot import RouteGraph, TransitionDirection, always
+
+PUSH = TransitionDirection.PUSH
+POP = TransitionDirection.POP
+
+
+def create_sut(*transitions, initial: str = "home") -> RouteGraph:
+    return RouteGraph(
+        [
+            (source, destination, direction, predicate or Mock())
+            for source, destination, direction, predicate in transitions
+        ],
+        initial_screen=initial,
+    )
+
+
+class TestDeadTransitions:
+    def test_when_source_is_unreachable__marks_transition_dead(self):
+        sut = create_sut(
+            ("home", "player", PUSH, None),
+            ("settings", "about", PUSH, None),
+        )
+
+        assert [dead.edge.position for dead in sut.dead_transitions] == [1]
+        assert "not reachable" in sut.dead_transitions[0].reason
+
+    def test_when_pop_destination_can_never_be_below_source__marks_transition_dead(
+        self,
+    ):
+        sut = create_sut(
+            ("home", "player", PUSH, None),
+            ("home", "settings", PUSH, None),
+            ("settings", "player", POP, None),
+            ("player", "home", POP, None),
+        )
+
+        assert [dead.edge.position for dead in sut.dead_transitions] == [2]
+
+    def test_when_earlier_transition_is_unconditional__marks_later_ones_dead(self):
+        sut = create_sut(
+            ("home", "player", PUSH, always),
+            ("home", "settings", PUSH, None),
+        )
+
+        assert [dead.edge.position for dead in sut.dead_transitions] == [1]
+        assert "shadowed" in sut.dead_transitions[0].reason
+
+    def test_when_source_is_pushed_by_event_transition__keeps_transition(self):
+        sut = RouteGraph(
+            [("settings", "home", POP, Mock())],
+            initial_screen="home",
+            event_transitions=[("home", "settings", PUSH)],
+        )
+
+        assert sut.dead_transitions == ()
+
+    def test_when_all_transitions_can_fire__returns_no_dead_transitions(self):
+        sut = create_sut(
+            ("home", "player", PUSH, None),
+            ("player", "home", POP, None),
+        )
+
+        assert sut.dead_transitions == ()
+
+
+class TestShortestPath:
+    def test_returns_fewest_transitions(self):
+        sut = create_sut(
+            ("home", "a", PUSH, None),
+            ("a", "b", PUSH, None),
+            ("b", "c", PUSH, None),
+            ("home", "c", PUSH, None),
+            ("c", "home", POP, None),
+        )
+
+        result = sut.shortest_path("home", "c")
+
+        assert [edge.position for edge in result] == [3]
+
+    def test_includes_pop_transitions(self):
+        sut = create_sut(
+            ("home", "a", PUSH, None),
+            ("a", "b", PUSH, None),
+            ("b", "home", POP, None),
+            ("home", "c", PUSH, None),
+        )
+
+        result = sut.shortest_path("b", "c")
+
+        assert [(edge.source, edge.destination) for edge in result] == [
+            ("b", "home"),
+            ("home", "c"),
+        ]
+
+    def test_when_destination_unreachable__returns_none(self):
+        sut = create_sut(("home", "a", PUSH, None))
+
+        assert sut.shortest_path("a", "home") is None
+        assert not sut.is_reachable("a", "home")
+        assert sut.is_reachable("home", "a")
@@ -0,0 +1,181 @@
+import time
+from typing import Any
+from unittest.mock import Mock, PropertyMock, create_autospec
+
+import pytest
+
+from src.pyllot import (
+    InvalidCapacityError,
+    InvalidJournalError,
+    NavigationJournal,
+    Router,
+    ScreenBase,
+    ScreenPresenting,
+    ScreensFactoryBase,
+    Transition,
+    TransitionDirection,
+)
+from src.pyllot import replay as replay_module
+from src.pyllot.replay import (
+    MixedTransitionsVersionsError,
+    UnknownTransitionError,
+    replay,
+)
+
+
+def create_screen(screen_name: str) -> ScreenBase:
+    screen = create_autospec(ScreenBase)
+    type(screen).screen_name = PropertyMock(return_value=screen_name)
+    return screen
+
+
+@pytest.fixture()
+def path(tmp_path):
+    return tmp_path / "navigation.journal"
+
+
+@pytest.fixture()
+def transitions() -> list[Transition]:
+    return [
+        Transition(
+            source="home",
+            destination="player",
+            direction=TransitionDirection.PUSH,
+            condition=lambda state: state == "play",
+        ),
+        Transition(
+            source="player",
+            destination="home",
+            direction=TransitionDirection.POP,
+            condition=lambda state: state == "stop",
+        ),
+    ]
+
+
+class TestNavigationJournal:
+    def test_read__returns_recorded_decisions_in_order(self, path):
+        with NavigationJournal(path) as sut:
+            sut.record(0, 0, TransitionDirection.PUSH, 2)
+            sut.record(1, 0, TransitionDirection.POP, 1)
+
+        records = NavigationJournal.read(path)
+
+        assert [record[1:] for record in records] == [
+            (0, 0, TransitionDirection.PUSH, 2),
+            (1, 0, TransitionDirection.POP, 1),
+        ]
+
+    def test_read__when_capacity_exceeded__returns_newest_records(self, path):
+        with NavigationJournal(path, capacity=2) as sut:
+            for depth in range(5):
+                sut.record(0, 0, TransitionDirection.PUSH, depth)
+
+        records = NavigationJournal.read(path)
+
+        assert [record.depth for record in records] == [3, 4]
+
+    def test_read__when_file_is_not_journal__raises_value_error(self, path):
+        path.write_bytes(b"foo" * 10)
+
+        with pytest.raises(InvalidJournalError, match="not a navigation journal"):
+            NavigationJournal.read(path)
+
+    def test_init__when_capacity_is_not_positive__raises_invalid_capacity_error(
+        self, path
+    ):
+        with pytest.raises(InvalidCapacityError):
+            NavigationJournal(path, capacity=0)
+
+    def test_router__records_performed_transitions(self, path, transitions):
+        factory = create_autospec(ScreensFactoryBase)
+        factory.create = Mock(side_effect=create_screen)
+        with NavigationJournal(path) as journal:
+            router: Router[str, ScreenBase] = Router(
+                initial_screen=create_screen("home"),
+                presenter=create_autospec(ScreenPresenting),
+                screens_factory=factory,
+                journal=journal,
+            )
+            router.update_transitions(add=transitions)
+
+            router.on_state("play")
+            router.on_state("noop")
+            router.on_state("stop")
+
+        records = NavigationJournal.read(path)
+
+        assert [record[1:] for record in records] == [
+            (0, router.transitions_version, TransitionDirection.PUSH, 2),
+            (1, router.transitions_version, TransitionDirection.POP, 1),
+        ]
+
+
+class TestReplay:
+    def test_replays_every_recorded_decision(self, path, transitions):
+        with NavigationJournal(path) as journal:
+            for _ in range(3):
+                journal.record(0, 0, TransitionDirection.PUSH, 2)
+                journal.record(1, 0, TransitionDirection.POP, 1)
+
+        result = replay(path, transitions)
+
+        assert result.decisions == 6
+        assert result.resyncs == 0
+
+    def test_when_recorded_source_is_not_displayed__restarts_from_it(
+        self, path, transitions
+    ):
+        with NavigationJournal(path) as journal:
+            journal.record(1, 0, TransitionDirection.POP, 1)
+            journal.record(0, 0, TransitionDirection.PUSH, 2)
+
+        result = replay(path, transitions)
+
+        assert result.decisions == 2
+        assert result.resyncs == 1
+
+    def test_elapsed__does_not_include_building_router(
+        self, path, transitions, monkeypatch
+    ):
+        build_router = replay_module._build_router
+
+        def slow_build_router(*args: Any) -> Any:
+            time.sleep(0.2)
+            return build_router(*args)
+
+        monkeypatch.setattr(replay_module, "_build_router", slow_build_router)
+        with NavigationJournal(path) as journal:
+            journal.record(1, 0, TransitionDirection.POP, 1)
+            journal.record(0, 0, TransitionDirection.PUSH, 2)
+
+        result = replay(path, transitions)
+
+        assert result.elapsed < 0.2
+
+    def test_when_transition_is_unknown__raises_value_error(self, path, transitions):
+        with NavigationJournal(path) as journal:
+            journal.record(5, 0, TransitionDirection.PUSH, 2)
+
+        with pytest.raises(UnknownTransitionError):
+            replay(path, transitions)
+
+    def test_when_versions_are_mixed__raises_mixed_transitions_versions_error(
+        self, path, transitions
+    ):
+        with NavigationJournal(path) as journal:
+            journal.record(0, 1, TransitionDirection.PUSH, 2)
+            journal.record(1, 2, TransitionDirection.POP, 1)
+
+        with pytest.raises(MixedTransitionsVersionsError):
+            replay(path, transitions)
+
+    def test_with_transitions_version__replays_only_decisions_of_that_version(
+        self, path, transitions
+    ):
+        with NavigationJournal(path) as journal:
+            journal.record(0, 1, TransitionDirection.PUSH, 2)
+            journal.record(5, 2, TransitionDirection.POP, 1)
+
+        result = replay(path, transitions, transitions_version=1)
+
+        assert result.decisions == 1
@@ -0,0 +1,101 @@
+import sys
+import textwrap
+
+import pytest
+
+from src.pyllot import LazyScreensFactory, UnregisteredScreenError
+
+SCREENS_MODULE = textwrap.dedent(
+    """
+    from src.pyllot import ScreenBase
+
+
+    class FooScreen(ScreenBase):
+        def __init__(self, title="foo"):
+            self.title = title
+
+        @property
+        def screen_name(self):
+            return "foo"
+
+        def will_present(self):
+            pass
+
+        def did_present(self):
+            pass
+
+        def will_disappear(self):
+            pass
+    """
+)
+
+
+@pytest.fixture()
+def module_name(tmp_path, monkeypatch) -> str:
+    (tmp_path / "lazy_screens.py").write_text(SCREENS_MODULE)
+    (tmp_path / "warm_screens.py").write_text(SCREENS_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_screens"
+    sys.modules.pop("lazy_screens", None)
+    sys.modules.pop("warm_screens", None)
+
+
+class TestLazyScreensFactory:
+    def test_register__does_not_import_module(self, module_name):
+        sut = LazyScreensFactory()
+
+        sut.register("foo", f"{module_name}:FooScreen")
+
+        assert module_name not in sys.modules
+
+    def test_create__returns_instance_of_registered_class(self, module_name):
+        sut = LazyScreensFactory()
+        sut.register("foo", f"{module_name}:FooScreen")
+
+        result = sut.create("foo")
+
+        assert type(result).__name__ == "FooScreen"
+        assert type(result).__module__ == module_name
+
+    def test_create__supports_dotted_paths(self, module_name):
+        sut = LazyScreensFactory()
+        sut.register("foo", f"{module_name}.FooScreen")
+
+        result = sut.create("foo")
+
+        assert type(result).__name__ == "FooScreen"
+
+    def test_create__passes_registered_kwargs_to_constructor(self, module_name):
+        sut = LazyScreensFactory()
+        sut.register("foo", f"{module_name}:FooScreen", title="bar")
+
+        result = sut.create("foo")
+
+        assert result.title == "bar"
+
+    def test_create__when_screen_not_registered__raises_unregistered_screen_error(
+        self,
+    ):
+        sut = LazyScreensFactory()
+
+        with pytest.raises(UnregisteredScreenError, match="bar"):
+            sut.create("bar")
+
+    def test_create__does_not_start_warm_up(self, module_name):
+        sut = LazyScreensFactory(warm_up=["warm"])
+        sut.register("foo", f"{module_name}:FooScreen")
+        sut.register("warm", "warm_screens:FooScreen")
+
+        sut.create("foo")
+
+        assert sut._warm_up_thread is None
+        assert "warm_screens" not in sys.modules
+
+    def test_start_warm_up__imports_warm_up_screens(self, module_name):
+        sut = LazyScreensFactory(warm_up=["warm"])
+        sut.register("warm", "warm_screens:FooScreen")
+
+        sut.start_warm_up()
+        sut._warm_up_thread.join()
+
+        assert "warm_screens" in sys.modules
@@ -0,0 +1,85 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.pyllot import NotMemoizableError, memoized
+from src.pyllot.memo import _EvaluationScope
+
+
+@pytest.fixture()
+def helper() -> Mock:
+    return Mock(side_effect=lambda state, *args: (state, args))
+
+
+class TestMemoized:
+    def test_outside_scope__calls_helper_every_time(self, helper):
+        sut = memoized(helper)
+        state = object()
+
+        sut(state)
+        sut(state)
+
+        assert helper.call_count == 2
+
+    def test_inside_scope__calls_helper_once_per_state(self, helper):
+        sut = memoized(helper)
+        state = object()
+
+        with _EvaluationScope():
+            first = sut(state)
+            second = sut(state)
+
+        assert first is second
+        helper.assert_called_once_with(state)
+
+    def test_inside_scope__distinguishes_states_and_arguments(self, helper):
+        sut = memoized(helper)
+        state = object()
+
+        with _EvaluationScope():
+            sut(state)
+            sut(object())
+            sut(state, "foo")
+            sut(state, "foo")
+
+        assert helper.call_count == 3
+
+    def test_inside_scope__does_not_memoize_unhashable_arguments(self, helper):
+        sut = memoized(helper)
+        state = object()
+
+        with _EvaluationScope():
+            sut(state, [])
+            sut(state, [])
+
+        assert helper.call_count == 2
+
+    def test_after_scope__forgets_results(self, helper):
+        sut = memoized(helper)
+        state = object()
+
+        with _EvaluationScope():
+            sut(state)
+        with _EvaluationScope():
+            sut(state)
+
+        assert helper.call_count == 2
+
+    def test_nested_scope__reuses_outer_scope(self, helper):
+        sut = memoized(helper)
+        state = object()
+
+        with _EvaluationScope():
+            sut(state)
+            with _EvaluationScope():
+                sut(state)
+            sut(state)
+
+        helper.assert_called_once_with(state)
+
+    def test_when_helper_is_coroutine_function__raises_not_memoizable_error(self):
+        async def helper(state: object) -> bool:
+            return True
+
+        with pytest.raises(NotMemoizableError):
+            memoized(helper)
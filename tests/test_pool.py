@@ -0,0 +1,167 @@
+import pytest
+
+from src.pyllot import (
+    NavigationEvent,
+    Router,
+    RouterPool,
+    ScreenBase,
+    SessionsFailedError,
+    ScreensFactoryBase,
+    Transition,
+    TransitionDirection,
+)
+
+FAILURE = "factory failed"
+
+
+class Screen(ScreenBase):
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def screen_name(self) -> str:
+        return self._name
+
+    def will_present(self) -> None:
+        pass
+
+    def did_present(self) -> None:
+        pass
+
+    def will_disappear(self) -> None:
+        pass
+
+
+class Factory(ScreensFactoryBase[Screen]):
+    def create(self, screen_name: str) -> Screen:
+        return Screen(screen_name)
+
+
+class NullPresenter:
+    def present(self, screen: Screen) -> None:
+        pass
+
+
+def is_playing(state: str) -> bool:
+    return state == "play"
+
+
+def is_stopped(state: str) -> bool:
+    return state == "stop"
+
+
+def create_router() -> Router[str, Screen]:
+    router: Router[str, Screen] = Router(
+        initial_screen=Screen("home"),
+        presenter=NullPresenter(),
+        screens_factory=Factory(),
+    )
+    router.add_transition(
+        Transition("home", "player", TransitionDirection.PUSH, is_playing)
+    )
+    router.add_transition(
+        Transition("player", "home", TransitionDirection.POP, is_stopped)
+    )
+    return router
+
+
+class UnpicklableError(Exception):
+    def __init__(self, reason: str, code: int):
+        super().__init__(f"{reason} ({code})")
+
+
+def fail() -> Router[str, Screen]:
+    raise RuntimeError(FAILURE)
+
+
+def is_playing_or_fail(state: str) -> bool:
+    if state == "crash":
+        raise UnpicklableError(FAILURE, 1)
+    return state == "play"
+
+
+def create_failing_router() -> Router[str, Screen]:
+    router = create_router()
+    router.add_transition(
+        Transition("home", "player", TransitionDirection.PUSH, is_playing_or_fail)
+    )
+    return router
+
+
+@pytest.fixture()
+def sut():
+    with RouterPool(create_router, processes=2) as pool:
+        yield pool
+
+
+class TestRouterPool:
+    def test_on_states__returns_navigation_events(self, sut):
+        result = sut.on_states([("a", "play"), ("b", "noop")])
+
+        assert result == [
+            NavigationEvent(session_id="a", source="home", destination="player", depth=2)
+        ]
+
+    def test_on_states__keeps_navigation_stack_of_session_between_batches(self, sut):
+        sut.on_states([("a", "play")])
+
+        result = sut.on_states([("a", "stop"), ("b", "stop")])
+
+        assert result == [
+            NavigationEvent(session_id="a", source="player", destination="home", depth=1)
+        ]
+
+    def test_on_states__evaluates_states_of_session_in_order(self, sut):
+        updates = [(session, state) for session in range(8) for state in ("play", "stop")]
+
+        result = sut.on_states(updates)
+
+        for session in range(8):
+            assert [e.destination for e in result if e.session_id == session] == [
+                "player",
+                "home",
+            ]
+
+    def test_end_sessions__discards_routers(self, sut):
+        sut.on_states([("a", "play")])
+
+        sut.end_sessions(["a"])
+        result = sut.on_states([("a", "stop")])
+
+        assert result == []
+
+    def test_when_session_fails__raises_error_with_failure(self):
+        with RouterPool(fail, processes=1) as pool, pytest.raises(
+            SessionsFailedError
+        ) as error:
+            pool.on_states([("a", "play")])
+
+        assert list(error.value.failures) == ["a"]
+        assert str(error.value.failures["a"]) == FAILURE
+
+    def test_when_session_fails__keeps_events_of_other_sessions(self):
+        with RouterPool(create_failing_router, processes=2) as pool, pytest.raises(
+            SessionsFailedError
+        ) as error:
+            pool.on_states(
+                [(session, "play") for session in range(4)]
+                + [(4, "crash"), (4, "play")]
+                + [(session, "stop") for session in range(4)]
+            )
+
+        assert sorted(e.session_id for e in error.value.events) == sorted(
+            [*range(4), *range(4)]
+        )
+        assert list(error.value.failures) == [4]
+
+    def test_when_exception_cannot_be_unpickled__replaces_it(self):
+        with RouterPool(create_failing_router, processes=1) as pool:
+            with pytest.raises(SessionsFailedError) as error:
+                pool.on_states([("a", "crash")])
+
+            result = pool.on_states([("a", "play")])
+
+        failure = error.value.failures["a"]
+        assert isinstance(failure, RuntimeError)
+        assert "UnpicklableError" in str(failure)
+        assert [e.destination for e in result] == ["player"]
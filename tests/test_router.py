@@ -1,15 +1,19 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 from unittest.mock import Mock, PropertyMock, create_autospec
 
 import pytest
 
 from src.pyllot import (
+    EventTransition,
     Router,
     ScreenBase,
     ScreenPresenting,
     ScreensFactoryBase,
     Transition,
     TransitionDirection,
+    always,
+    memoized,
 )
 from src.pyllot._stack import _NavigationStack
 
@@ -91,6 +95,7 @@ def create_transition() -> (
         transition.destination = destination or ""
         transition.direction = direction or TransitionDirection.PUSH
         transition.should_transition = Mock(return_value=should_transition or False)
+        transition.condition = transition.should_transition
         return transition
 
     return wrapped
@@ -312,6 +317,343 @@ class TestOnState:
 
         sut._navigation_stack.push.assert_called_once_with(expected_screen)
 
+    def test_transitions_sharing_condition__store_condition_once(self, create_sut):
+        sut = create_sut()
+        condition = Mock(return_value=False)
+
+        for destination in ("foo", "bar", "baz"):
+            sut.add_transition(
+                Transition("initial", destination, TransitionDirection.PUSH, condition)
+            )
+
+        assert list(sut._transitions._predicates) == [condition]
+
+    def test_when_condition_is_unhashable__evaluates_it(
+        self, create_sut, create_screens_factory
+    ):
+        class Condition:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __call__(self, state: State) -> bool:
+                return True
+
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        sut.add_transition(
+            Transition("initial", "foo", TransitionDirection.PUSH, Condition())
+        )
+
+        sut.on_state(Mock())
+
+        screens_factory.create.assert_called_once_with(screen_name="foo")
+
+    def test_when_should_transition_is_overridden__evaluates_override(
+        self, create_sut, create_screens_factory
+    ):
+        class NeverTransition(Transition[State]):
+            def should_transition(self, state: State) -> bool:
+                return False
+
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        sut.add_transition(
+            NeverTransition("initial", "foo", TransitionDirection.PUSH, lambda _: True)
+        )
+
+        sut.on_state(Mock())
+
+        screens_factory.create.assert_not_called()
+
+    def test_calls_memoized_helper_once_across_transitions(
+        self, create_sut, create_screens_factory
+    ):
+        helper = Mock(return_value=False)
+        memoized_helper = memoized(helper)
+        sut = create_sut(factory=create_screens_factory())
+        for destination in ("foo", "bar"):
+            sut.add_transition(
+                Transition(
+                    source="initial",
+                    destination=destination,
+                    direction=TransitionDirection.PUSH,
+                    condition=memoized_helper,
+                )
+            )
+        state = Mock()
+
+        sut.on_state(state)
+        sut.on_state(state)
+
+        assert helper.call_count == 2
+
+
+class BackPressed:
+    pass
+
+
+class TestOnEvent:
+    def test_when_transition_registered_for_event_name__performs_it(
+        self, create_sut, create_screen, create_screens_factory, navigation_stack
+    ):
+        expected_screen = create_screen("foo")
+        sut = create_sut(factory=create_screens_factory(will_return=expected_screen))
+        sut.add_event_transition(
+            EventTransition(
+                source="initial",
+                destination="foo",
+                direction=TransitionDirection.PUSH,
+                event="play",
+            )
+        )
+
+        sut.on_event("play")
+
+        sut._navigation_stack.push.assert_called_once_with(expected_screen)
+
+    def test_when_transition_registered_for_event_type__performs_it(
+        self, create_sut, navigation_stack
+    ):
+        sut = create_sut()
+        sut.add_event_transition(
+            EventTransition(
+                source="initial",
+                destination="foo",
+                direction=TransitionDirection.POP,
+                event=BackPressed,
+            )
+        )
+
+        sut.on_event(BackPressed())
+
+        sut._navigation_stack.pop.assert_called_once_with(destination="foo")
+
+    def test_when_transition_registered_for_other_source__does_not_perform_it(
+        self, create_sut, navigation_stack
+    ):
+        guard = Mock(return_value=True)
+        sut = create_sut()
+        sut.add_event_transition(
+            EventTransition(
+                source="foo",
+                destination="bar",
+                direction=TransitionDirection.PUSH,
+                event="play",
+                guard=guard,
+            )
+        )
+
+        sut.on_event("play")
+
+        guard.assert_not_called()
+        sut._navigation_stack.push.assert_not_called()
+
+    def test_when_guard_fails__performs_next_transition_for_event(
+        self, create_sut, create_screens_factory, navigation_stack
+    ):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        sut.add_event_transition(
+            EventTransition(
+                source="initial",
+                destination="foo",
+                direction=TransitionDirection.PUSH,
+                event="play",
+                guard=Mock(return_value=False),
+            )
+        )
+        sut.add_event_transition(
+            EventTransition(
+                source="initial",
+                destination="bar",
+                direction=TransitionDirection.PUSH,
+                event="play",
+            )
+        )
+
+        sut.on_event("play")
+
+        screens_factory.create.assert_called_once_with(screen_name="bar")
+
+    def test_does_not_evaluate_state_transitions(
+        self, create_sut, create_push_transition, navigation_stack
+    ):
+        transition = create_push_transition(source="initial", should_transition=True)
+        sut = create_sut()
+        sut.add_transition(transition)
+
+        sut.on_event("play")
+
+        transition.should_transition.assert_not_called()
+        sut._navigation_stack.push.assert_not_called()
+
+
+class TestChildRouters:
+    def test_when_no_valid_transition_found__forwards_state_to_active_child(
+        self, create_sut, create_push_transition
+    ):
+        state = Mock()
+        child = create_autospec(Router, instance=True)
+        sut = create_sut()
+        sut.add_child("initial", child)
+        sut.add_transition(create_push_transition(source="initial"))
+
+        sut.on_state(state)
+
+        child.on_state.assert_called_once_with(state)
+
+    def test_when_valid_transition_found__does_not_forward_state_to_active_child(
+        self, create_sut, create_push_transition
+    ):
+        child = create_autospec(Router, instance=True)
+        sut = create_sut()
+        sut.add_child("initial", child)
+        sut.add_transition(
+            create_push_transition(source="initial", should_transition=True)
+        )
+
+        sut.on_state(Mock())
+
+        child.on_state.assert_not_called()
+
+    def test_does_not_forward_state_to_children_of_inactive_screens(self, create_sut):
+        child = create_autospec(Router, instance=True)
+        sut = create_sut()
+        sut.add_child("foo", child)
+
+        sut.on_state(Mock())
+
+        child.on_state.assert_not_called()
+
+    def test_when_no_valid_event_transition_found__forwards_event_to_active_child(
+        self, create_sut
+    ):
+        child = create_autospec(Router, instance=True)
+        sut = create_sut()
+        sut.add_child("initial", child)
+
+        sut.on_event("play")
+
+        child.on_event.assert_called_once_with("play")
+
+    def test_active_child__returns_child_of_current_screen(self, create_sut):
+        child = create_autospec(Router, instance=True)
+        sut = create_sut()
+        sut.add_child("initial", child)
+        sut.add_child("foo", create_autospec(Router, instance=True))
+
+        assert sut.active_child is child
+
+
+class TestUpdateTransitions:
+    def test_remove__transition_is_no_longer_evaluated(
+        self, create_sut, create_push_transition
+    ):
+        transition = create_push_transition(source="initial", should_transition=True)
+        sut = create_sut()
+        sut.add_transition(transition)
+
+        sut.update_transitions(remove=[transition])
+        sut.on_state(Mock())
+
+        transition.should_transition.assert_not_called()
+        sut._navigation_stack.push.assert_not_called()
+
+    def test_returns_new_version(self, create_sut, create_push_transition):
+        sut = create_sut()
+        version = sut.transitions_version
+
+        result = sut.update_transitions(add=[create_push_transition()])
+
+        assert result == sut.transitions_version
+        assert result > version
+
+    def test_change_during_evaluation__is_not_visible_to_evaluation(
+        self, create_sut, create_push_transition, create_screens_factory
+    ):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        added = create_push_transition(
+            source="initial", destination="bar", should_transition=True
+        )
+        first = create_push_transition(source="initial", destination="foo")
+        first.should_transition = Mock(
+            side_effect=lambda _: sut.update_transitions(add=[added]) and False
+        )
+        first.condition = first.should_transition
+        sut.add_transition(first)
+
+        sut.on_state(Mock())
+
+        added.should_transition.assert_not_called()
+        screens_factory.create.assert_not_called()
+
+    def test_unhashable_condition__is_added_and_removed(
+        self, create_sut, create_screens_factory
+    ):
+        class Condition:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __call__(self, state: State) -> bool:
+                return True
+
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        transition = Transition("initial", "foo", TransitionDirection.PUSH, Condition())
+
+        sut.add_transition(transition)
+        sut.update_transitions(remove=[transition])
+        sut.on_state(Mock())
+
+        screens_factory.create.assert_not_called()
+
+
+class TestAnalyze:
+    def test_prune__drops_dead_transitions_from_evaluation(
+        self, create_sut, create_push_transition, create_screens_factory
+    ):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        sut.add_transition(
+            Transition("initial", "foo", TransitionDirection.PUSH, condition=always)
+        )
+        shadowed = create_push_transition(
+            source="initial", destination="bar", should_transition=True
+        )
+        sut.add_transition(shadowed)
+
+        graph = sut.analyze()
+        sut.on_state(Mock())
+
+        assert [dead.edge.position for dead in graph.dead_transitions] == [1]
+        shadowed.should_transition.assert_not_called()
+        screens_factory.create.assert_called_once_with(screen_name="foo")
+
+    def test_without_prune__keeps_dead_transitions(
+        self, create_sut, create_push_transition
+    ):
+        sut = create_sut()
+        sut.add_transition(create_push_transition(source="unreachable"))
+        version = sut.transitions_version
+
+        graph = sut.analyze(prune=False)
+
+        assert len(graph.dead_transitions) == 1
+        assert sut.transitions_version == version
+
+    def test_screen_pushed_by_event_transition__keeps_its_transitions(self, create_sut):
+        sut = create_sut()
+        sut.add_event_transition(
+            EventTransition("initial", "settings", TransitionDirection.PUSH, "open")
+        )
+        sut.add_transition(
+            Transition("settings", "initial", TransitionDirection.POP, always)
+        )
+
+        graph = sut.analyze()
+
+        assert graph.dead_transitions == ()
+        assert "settings" in graph.reachable_screens
+
 
 class TestCurrentScreen:
     def test_returns_result_of_peeking_at_navigation_stack(
@@ -323,3 +665,155 @@ class TestCurrentScreen:
         sut = create_sut()
 
         assert sut.current_screen == expected_screen
+
+
+class TestSuspendedScreens:
+    def test_returns_suspended_screens_of_navigation_stack(
+        self, create_sut, create_screen, navigation_stack
+    ):
+        expected_screens = (create_screen("foo"), create_screen("bar"))
+        navigation_stack.suspended = Mock(return_value=expected_screens)
+
+        sut = create_sut()
+
+        assert sut.suspended_screens == expected_screens
+
+
+class TestOnStateAsync:
+    @staticmethod
+    def create_predicate(
+        result: bool, delay: float = 0
+    ) -> tuple[Callable[[object], Awaitable[bool]], dict[str, int]]:
+        calls = {"started": 0, "finished": 0}
+
+        async def predicate(state) -> bool:
+            calls["started"] += 1
+            await asyncio.sleep(delay)
+            calls["finished"] += 1
+            return result
+
+        return predicate, calls
+
+    def add(self, sut, destination: str, predicate) -> None:
+        sut.add_transition(
+            Transition(
+                source="initial",
+                destination=destination,
+                direction=TransitionDirection.PUSH,
+                condition=predicate,
+            )
+        )
+
+    def test_performs_first_added_transition_evaluating_as_true(
+        self, create_sut, create_screens_factory
+    ):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        self.add(sut, "foo", self.create_predicate(False, delay=0.02)[0])
+        self.add(sut, "bar", self.create_predicate(True, delay=0.04)[0])
+        self.add(sut, "baz", self.create_predicate(True)[0])
+
+        asyncio.run(sut.on_state_async(Mock()))
+
+        screens_factory.create.assert_called_once_with(screen_name="bar")
+
+    def test_evaluates_predicates_concurrently(self, create_sut):
+        sut = create_sut()
+        events: list[str] = []
+
+        def create_logging_predicate(
+            destination: str,
+        ) -> Callable[[object], Awaitable[bool]]:
+            async def predicate(state) -> bool:
+                events.append(f"started {destination}")
+                await asyncio.sleep(0)
+                events.append(f"finished {destination}")
+                return False
+
+            return predicate
+
+        for destination in ("foo", "bar", "baz"):
+            self.add(sut, destination, create_logging_predicate(destination))
+
+        asyncio.run(sut.on_state_async(Mock()))
+
+        assert events[:3] == ["started foo", "started bar", "started baz"]
+        assert sorted(events[3:]) == ["finished bar", "finished baz", "finished foo"]
+
+    def test_cancels_evaluations_of_transitions_added_after_valid_one(
+        self, create_sut, create_screens_factory
+    ):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        self.add(sut, "foo", self.create_predicate(True)[0])
+        slow, calls = self.create_predicate(True, delay=1)
+        self.add(sut, "bar", slow)
+
+        asyncio.run(sut.on_state_async(Mock()))
+
+        assert calls == {"started": 1, "finished": 0}
+        screens_factory.create.assert_called_once_with(screen_name="foo")
+
+    def test_when_predicate_times_out__treats_it_as_false(
+        self, create_sut, create_screens_factory
+    ):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        self.add(sut, "foo", self.create_predicate(True, delay=1)[0])
+        self.add(sut, "bar", self.create_predicate(True, delay=0.01)[0])
+
+        asyncio.run(sut.on_state_async(Mock(), timeout=0.05))
+
+        screens_factory.create.assert_called_once_with(screen_name="bar")
+
+    def test_supports_synchronous_predicates(self, create_sut, create_screens_factory):
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        self.add(sut, "foo", lambda _: False)
+        self.add(sut, "bar", lambda _: True)
+
+        asyncio.run(sut.on_state_async(Mock()))
+
+        screens_factory.create.assert_called_once_with(screen_name="bar")
+
+    def test_when_predicate_after_valid_one_fails__ignores_failure(
+        self, create_sut, create_screens_factory
+    ):
+        async def failing(state) -> bool:
+            raise RuntimeError
+
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        self.add(sut, "foo", self.create_predicate(True, delay=0.02)[0])
+        self.add(sut, "bar", failing)
+
+        asyncio.run(sut.on_state_async(Mock()))
+
+        screens_factory.create.assert_called_once_with(screen_name="foo")
+
+    def test_when_predicate_before_valid_one_fails__raises_failure(
+        self, create_sut, create_screens_factory
+    ):
+        async def failing(state) -> bool:
+            await asyncio.sleep(0.02)
+            raise RuntimeError
+
+        screens_factory = create_screens_factory()
+        sut = create_sut(factory=screens_factory)
+        self.add(sut, "foo", failing)
+        self.add(sut, "bar", self.create_predicate(True)[0])
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(sut.on_state_async(Mock()))
+
+        screens_factory.create.assert_not_called()
+
+
+class TestSnapshot:
+    def test_returns_snapshot_of_navigation_stack(self, create_sut, navigation_stack):
+        expected_snapshot = Mock()
+        navigation_stack.snapshot = Mock(return_value=expected_snapshot)
+
+        sut = create_sut()
+
+        assert sut.snapshot() is expected_snapshot
@@ -0,0 +1,201 @@
+import json
+import os
+from unittest.mock import Mock, PropertyMock, create_autospec
+
+import pytest
+
+from src.pyllot import (
+    CompiledRoutes,
+    InvalidRoutesError,
+    MissingPredicatesError,
+    Router,
+    ScreenBase,
+    ScreenPresenting,
+    ScreensFactoryBase,
+    TransitionDirection,
+)
+
+ROUTES_TOML = """
+[[transitions]]
+source = "home"
+destination = "video_player"
+direction = "push"
+condition = "has_current_video"
+
+[[transitions]]
+source = "video_player"
+destination = "home"
+direction = "pop"
+condition = "has_no_current_video"
+"""
+
+
+@pytest.fixture()
+def toml_path(tmp_path):
+    path = tmp_path / "routes.toml"
+    path.write_text(ROUTES_TOML)
+    return path
+
+
+def write_json(tmp_path, transitions) -> str:
+    path = tmp_path / "routes.json"
+    path.write_text(json.dumps({"transitions": transitions}))
+    return path
+
+
+class TestCompile:
+    def test_returns_transitions_in_order_of_file(self, toml_path):
+        result = CompiledRoutes.compile(toml_path)
+
+        assert list(result) == [
+            ("home", "video_player", TransitionDirection.PUSH, "has_current_video"),
+            ("video_player", "home", TransitionDirection.POP, "has_no_current_video"),
+        ]
+
+    def test_parses_json_files(self, tmp_path):
+        path = write_json(
+            tmp_path,
+            [
+                {
+                    "source": "home",
+                    "destination": "foo",
+                    "direction": "push",
+                    "condition": "bar",
+                }
+            ],
+        )
+
+        result = CompiledRoutes.compile(path)
+
+        assert list(result) == [("home", "foo", TransitionDirection.PUSH, "bar")]
+
+    def test_when_field_is_missing__raises_invalid_routes_error(self, tmp_path):
+        path = write_json(tmp_path, [{"source": "home", "destination": "foo"}])
+
+        with pytest.raises(InvalidRoutesError, match="missing 'direction'"):
+            CompiledRoutes.compile(path)
+
+    def test_when_direction_is_unknown__raises_invalid_routes_error(self, tmp_path):
+        path = write_json(
+            tmp_path,
+            [
+                {
+                    "source": "home",
+                    "destination": "foo",
+                    "direction": "sideways",
+                    "condition": "bar",
+                }
+            ],
+        )
+
+        with pytest.raises(InvalidRoutesError, match="unknown direction"):
+            CompiledRoutes.compile(path)
+
+    def test_when_pop_destination_never_pushes__raises_invalid_routes_error(
+        self, tmp_path
+    ):
+        path = write_json(
+            tmp_path,
+            [
+                {
+                    "source": "home",
+                    "destination": "foo",
+                    "direction": "pop",
+                    "condition": "bar",
+                }
+            ],
+        )
+
+        with pytest.raises(InvalidRoutesError, match="can never be on the stack"):
+            CompiledRoutes.compile(path)
+
+
+class TestLoad:
+    def test_writes_artifact_to_cache_dir(self, toml_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+
+        CompiledRoutes.load(toml_path, cache_dir=cache_dir)
+
+        assert len(list(cache_dir.glob("routes-*.pyllotc"))) == 1
+
+    def test_when_cache_dir_is_not_writable__returns_routes(self, toml_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("")
+
+        result = CompiledRoutes.load(toml_path, cache_dir=cache_dir)
+
+        assert list(result) == list(CompiledRoutes.compile(toml_path))
+
+    def test_when_writing_artifact_fails__removes_temporary_file(
+        self, toml_path, tmp_path, monkeypatch
+    ):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(os, "replace", Mock(side_effect=PermissionError))
+
+        CompiledRoutes.load(toml_path, cache_dir=cache_dir)
+
+        assert list(cache_dir.iterdir()) == []
+
+    def test_when_artifact_is_cached__does_not_parse_file(
+        self, toml_path, tmp_path, monkeypatch
+    ):
+        cache_dir = tmp_path / "cache"
+        expected = list(CompiledRoutes.load(toml_path, cache_dir=cache_dir))
+        monkeypatch.setattr(CompiledRoutes, "_compile", Mock(side_effect=AssertionError))
+
+        result = CompiledRoutes.load(toml_path, cache_dir=cache_dir)
+
+        assert list(result) == expected
+
+    def test_when_file_changes__recompiles(self, toml_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+        CompiledRoutes.load(toml_path, cache_dir=cache_dir)
+        toml_path.write_text(ROUTES_TOML.replace("has_current_video", "foo"))
+
+        result = CompiledRoutes.load(toml_path, cache_dir=cache_dir)
+
+        assert "foo" in result.conditions
+
+    def test_dumps_and_loads__round_trip(self, toml_path):
+        routes = CompiledRoutes.compile(toml_path)
+
+        result = CompiledRoutes.loads(routes.dumps())
+
+        assert list(result) == list(routes)
+
+
+class TestRouterAddRoutes:
+    @pytest.fixture()
+    def router(self) -> Router:
+        screen = create_autospec(ScreenBase)
+        type(screen).screen_name = PropertyMock(return_value="home")
+        return Router(
+            initial_screen=screen,
+            presenter=create_autospec(ScreenPresenting),
+            screens_factory=create_autospec(ScreensFactoryBase),
+        )
+
+    def test_adds_transitions_with_registered_predicates(self, router, toml_path):
+        has_current_video = Mock(return_value=True)
+        router.add_routes(
+            CompiledRoutes.compile(toml_path),
+            predicates={
+                "has_current_video": has_current_video,
+                "has_no_current_video": Mock(),
+            },
+        )
+        state = Mock()
+
+        router.on_state(state)
+
+        has_current_video.assert_called_once_with(state)
+        router._screens_factory.create.assert_called_once_with(screen_name="video_player")
+
+    def test_when_predicate_is_missing__raises_missing_predicates_error(
+        self, router, toml_path
+    ):
+        with pytest.raises(MissingPredicatesError, match="has_no_current_video"):
+            router.add_routes(
+                CompiledRoutes.compile(toml_path),
+                predicates={"has_current_video": Mock()},
+            )
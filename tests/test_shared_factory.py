@@ -0,0 +1,77 @@
+import gc
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from src.pyllot import ScreenBase, ScreensFactoryBase, SharedScreensFactory
+
+
+class Screen(ScreenBase):
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def screen_name(self) -> str:
+        return self._name
+
+    def will_present(self) -> None:
+        pass
+
+    def did_present(self) -> None:
+        pass
+
+    def will_disappear(self) -> None:
+        pass
+
+
+class SharedScreen(Screen):
+    shareable = True
+
+
+@pytest.fixture()
+def create_factory():
+    def wrapped(screen_type: type[Screen]) -> ScreensFactoryBase:
+        factory = create_autospec(ScreensFactoryBase)
+        factory.create = Mock(side_effect=lambda screen_name: screen_type(screen_name))
+        return factory
+
+    return wrapped
+
+
+class TestSharedScreensFactory:
+    def test_when_screen_is_shareable__returns_same_instance(self, create_factory):
+        sut = SharedScreensFactory(create_factory(SharedScreen))
+
+        first = sut.create("help")
+        second = sut.create("help")
+
+        assert first is second
+
+    def test_when_screen_is_shareable__shares_instance_across_factories(
+        self, create_factory
+    ):
+        factory = create_factory(SharedScreen)
+
+        first = SharedScreensFactory(create_factory(SharedScreen)).create("about")
+        second = SharedScreensFactory(factory).create("about")
+
+        assert first is second
+        factory.create.assert_not_called()
+
+    def test_when_screen_is_not_shareable__creates_new_instance(self, create_factory):
+        sut = SharedScreensFactory(create_factory(Screen))
+
+        first = sut.create("home")
+        second = sut.create("home")
+
+        assert first is not second
+
+    def test_when_shared_screen_is_released__creates_new_instance(self, create_factory):
+        factory = create_factory(SharedScreen)
+        sut = SharedScreensFactory(factory)
+        sut.create("error")
+        gc.collect()
+
+        sut.create("error")
+
+        assert factory.create.call_count == 2
@@ -3,7 +3,7 @@ from unittest.mock import Mock, PropertyMock, create_autospec
 
 import pytest
 
-from src.pyllot import ScreenBase, ScreenPresenting
+from src.pyllot import MemoryDiagnostics, ScreenBase, ScreenPresenting
 from src.pyllot._stack import _NavigationStack
 
 
@@ -203,3 +203,145 @@ class TestPop:
 
         screen_presenter.present.assert_called_once()
         initial_screen.did_present.assert_called_once()
+
+    def test_when_destination_is_on_stack_multiple_times__pops_to_lowest_one(
+        self, create_sut, create_screen
+    ):
+        lowest = create_screen("foo")
+        sut = create_sut()
+        sut.push(lowest)
+        sut.push(create_screen("bar"))
+        sut.push(create_screen("foo"))
+
+        result = sut.pop(destination="foo")
+
+        assert result is lowest
+        assert sut.peek() is lowest
+
+    def test_when_destination_is_on_stack__reports_popped_screens_to_diagnostics(
+        self, screen_presenter, initial_screen, create_screen
+    ):
+        diagnostics = create_autospec(MemoryDiagnostics)
+        diagnostics.measure.return_value = 0
+        foo_screen = create_screen("foo")
+        bar_screen = create_screen("bar")
+        sut = _NavigationStack(
+            presenter=screen_presenter,
+            initial_screen=initial_screen,
+            diagnostics=diagnostics,
+        )
+        sut.push(foo_screen)
+        sut.push(bar_screen)
+
+        sut.pop(destination="initial")
+
+        diagnostics.did_pop.assert_called_once()
+        (popped,) = diagnostics.did_pop.call_args.args
+        assert popped == [foo_screen, bar_screen]
+        assert list(diagnostics.did_pop.call_args.kwargs["remaining"]) == [initial_screen]
+
+
+class TestSuspendResume:
+    def test_push__calls_did_suspend_on_covered_screen_after_presenting(
+        self, create_sut, create_screen, screen_presenter
+    ):
+        initial_screen = create_screen("initial")
+
+        def present(screen: ScreenBase) -> None:
+            initial_screen.did_suspend.assert_not_called()
+
+        screen_presenter.present = Mock(side_effect=present)
+        sut = create_sut(initial=initial_screen)
+
+        sut.push(create_screen("foo"))
+
+        initial_screen.did_suspend.assert_called_once()
+
+    def test_pop__calls_will_resume_on_destination_before_presenting(
+        self, create_sut, create_screen, screen_presenter
+    ):
+        initial_screen = create_screen("initial")
+        sut = create_sut(initial=initial_screen)
+        sut.push(create_screen("foo"))
+
+        def present(screen: ScreenBase) -> None:
+            initial_screen.will_resume.assert_called_once()
+
+        screen_presenter.present = Mock(side_effect=present)
+        sut.pop(destination="initial")
+
+        screen_presenter.present.assert_called_once()
+
+    def test_pop__to_screen_on_top__does_not_call_will_resume(
+        self, create_sut, create_screen
+    ):
+        foo_screen = create_screen("foo")
+        sut = create_sut()
+        sut.push(foo_screen)
+
+        sut.pop(destination="foo")
+
+        foo_screen.will_resume.assert_not_called()
+
+    def test_suspended__returns_covered_screens_from_bottom(
+        self, create_sut, create_screen, initial_screen
+    ):
+        foo_screen = create_screen("foo")
+        sut = create_sut()
+        sut.push(foo_screen)
+        sut.push(create_screen("bar"))
+
+        assert sut.suspended() == (initial_screen, foo_screen)
+
+    def test_push__shared_instance_over_itself__does_not_suspend_it(
+        self, create_sut, create_screen, initial_screen
+    ):
+        help_screen = create_screen("help")
+        sut = create_sut()
+        sut.push(help_screen)
+
+        sut.push(help_screen)
+
+        help_screen.did_suspend.assert_not_called()
+        assert sut.suspended() == (initial_screen,)
+
+    def test_pop__to_shared_instance_on_top__does_not_call_will_resume(
+        self, create_sut, create_screen, initial_screen
+    ):
+        help_screen = create_screen("help")
+        sut = create_sut()
+        sut.push(help_screen)
+        sut.push(help_screen)
+
+        sut.pop(destination="help")
+
+        help_screen.will_resume.assert_not_called()
+        assert sut.suspended() == (initial_screen,)
+        assert len(sut) == 2
+
+
+class TestSnapshot:
+    def test_returns_screens_from_bottom(self, create_sut, create_screen, initial_screen):
+        foo_screen = create_screen("foo")
+        sut = create_sut()
+        sut.push(foo_screen)
+
+        snapshot = sut.snapshot()
+
+        assert snapshot.screens == (initial_screen, foo_screen)
+        assert snapshot.current_screen is foo_screen
+        assert len(snapshot) == 2
+
+    def test_is_not_affected_by_later_navigation(
+        self, create_sut, create_screen, initial_screen
+    ):
+        foo_screen = create_screen("foo")
+        sut = create_sut()
+        sut.push(foo_screen)
+        snapshot = sut.snapshot()
+
+        sut.pop(destination="initial")
+        sut.push(create_screen("bar"))
+
+        assert snapshot.screens == (initial_screen, foo_screen)
+        assert len(sut) == 2
@@ -0,0 +1,158 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.pyllot import TransitionDirection
+from src.pyllot._registry import _ScreenRegistry
+from src.pyllot._table import _TransitionTable
+
+
+class TestScreenRegistry:
+    def test_intern__returns_same_id_for_same_name(self):
+        sut = _ScreenRegistry()
+        first = sut.intern("foo")
+        sut.intern("bar")
+
+        assert sut.intern("foo") == first
+
+    def test_get__when_name_not_interned__returns_minus_one(self):
+        sut = _ScreenRegistry()
+
+        assert sut.get("foo") == -1
+
+    def test_name__returns_interned_name(self):
+        sut = _ScreenRegistry()
+
+        assert sut.name(sut.intern("foo")) == "foo"
+
+    def test_intern__from_multiple_threads__assigns_distinct_ids(self):
+        sut = _ScreenRegistry()
+        names = [f"screen-{index}" for index in range(1000)]
+
+        def intern_all(offset: int) -> None:
+            for name in names[offset:] + names[:offset]:
+                sut.intern(name)
+
+        threads = [
+            threading.Thread(target=intern_all, args=(offset,))
+            for offset in range(0, 1000, 125)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(sut.intern(name) for name in names) == list(range(1000))
+        assert [sut.name(sut.intern(name)) for name in names] == names
+
+
+class TestTransitionTable:
+    def test_rows__returns_rows_of_source_in_order_of_adding(self):
+        sut = _TransitionTable(_ScreenRegistry()).extended(
+            [
+                ("foo", "bar", TransitionDirection.PUSH, Mock()),
+                ("bar", "foo", TransitionDirection.POP, Mock()),
+                ("foo", "baz", TransitionDirection.PUSH, Mock()),
+            ]
+        )
+
+        assert list(sut.rows(sut.registry.get("foo"))) == [0, 2]
+
+    def test_rows__when_source_unknown__returns_empty(self):
+        sut = _TransitionTable(_ScreenRegistry()).extended(
+            [("foo", "bar", TransitionDirection.PUSH, Mock())]
+        )
+
+        assert not sut.rows(sut.registry.get("baz"))
+
+    def test_row_accessors__return_added_values(self):
+        predicate = Mock()
+        sut = _TransitionTable(_ScreenRegistry()).extended(
+            [("foo", "bar", TransitionDirection.POP, predicate)]
+        )
+
+        assert sut.source(0) == "foo"
+        assert sut.destination(0) == "bar"
+        assert sut.direction(0) == TransitionDirection.POP
+        assert sut.predicate(0) is predicate
+
+    def test_extended__stores_identical_predicates_once(self):
+        predicate = Mock()
+        sut = _TransitionTable(_ScreenRegistry()).extended(
+            [
+                ("foo", "bar", TransitionDirection.PUSH, predicate),
+                ("bar", "foo", TransitionDirection.POP, predicate),
+            ]
+        )
+
+        assert len(sut._predicates) == 1
+
+    def test_extended__stores_unhashable_predicates_without_deduplication(self):
+        predicate = Mock(__hash__=None)
+        sut = _TransitionTable(_ScreenRegistry()).extended(
+            [
+                ("foo", "bar", TransitionDirection.PUSH, predicate),
+                ("bar", "foo", TransitionDirection.POP, predicate),
+            ]
+        )
+
+        assert list(sut._predicates) == [predicate, predicate]
+        assert sut.predicate(1) is predicate
+
+    def test_extended__does_not_change_previous_version(self):
+        previous = _TransitionTable(_ScreenRegistry()).extended(
+            [("foo", "bar", TransitionDirection.PUSH, Mock())]
+        )
+
+        sut = previous.extended([("foo", "baz", TransitionDirection.PUSH, Mock())])
+
+        assert len(previous) == 1
+        assert list(previous.rows(previous.registry.get("foo"))) == [0]
+        assert list(sut.rows(sut.registry.get("foo"))) == [0, 1]
+        assert sut.version == previous.version + 1
+
+    def test_without__removes_rows_and_keeps_previous_version(self):
+        previous = _TransitionTable(_ScreenRegistry()).extended(
+            [
+                ("foo", "bar", TransitionDirection.PUSH, Mock()),
+                ("foo", "baz", TransitionDirection.PUSH, Mock()),
+            ]
+        )
+
+        sut = previous.without({0})
+
+        assert [row[1] for row in sut] == ["baz"]
+        assert [row[1] for row in previous] == ["bar", "baz"]
+
+    def test_extended__single_rows__scale_linearly(self):
+        predicate = Mock()
+        sut = _TransitionTable(_ScreenRegistry())
+
+        started_at = time.perf_counter()
+        for index in range(20000):
+            sut = sut.extended(
+                [(f"s{index}", f"s{index + 1}", TransitionDirection.PUSH, predicate)]
+            )
+
+        assert time.perf_counter() - started_at < 1.0
+        assert len(sut) == 20000
+        assert list(sut.rows(sut.registry.get("s19999"))) == [19999]
+
+    def test_extended__after_interrupted_update__drops_its_rows(self):
+        previous = _TransitionTable(_ScreenRegistry()).extended(
+            [("foo", "bar", TransitionDirection.PUSH, Mock())]
+        )
+        with pytest.raises(AttributeError):
+            previous.extended(
+                [
+                    ("foo", "baz", TransitionDirection.PUSH, Mock()),
+                    ("foo", "qux", "push", Mock()),  # type: ignore[list-item]
+                ]
+            )
+
+        sut = previous.extended([("foo", "quux", TransitionDirection.PUSH, Mock())])
+
+        assert [row[1] for row in sut] == ["bar", "quux"]
+        assert list(sut.rows(sut.registry.get("foo"))) == [0, 1]
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from src.pyllot import AsyncioScheduler, Router, ThreadSafeRouter, TkinterScheduler
+
+
+class ManualScheduler:
+    def __init__(self):
+        self.callbacks: list[Callable[[], None]] = []
+
+    def schedule(self, callback: Callable[[], None]) -> None:
+        self.callbacks.append(callback)
+
+    def run(self) -> None:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+@pytest.fixture()
+def router() -> Router:
+    return create_autospec(Router, instance=True)
+
+
+@pytest.fixture()
+def scheduler() -> ManualScheduler:
+    return ManualScheduler()
+
+
+class TestThreadSafeRouter:
+    def test_on_state__does_not_evaluate_state_before_scheduled_callback(
+        self, router, scheduler
+    ):
+        sut = ThreadSafeRouter(router=router, scheduler=scheduler)
+
+        sut.on_state(Mock())
+
+        router.on_state.assert_not_called()
+
+    def test_on_state__schedules_one_evaluation_for_many_states(self, router, scheduler):
+        sut = ThreadSafeRouter(router=router, scheduler=scheduler)
+
+        for state in range(10):
+            sut.on_state(state)
+
+        assert len(scheduler.callbacks) == 1
+
+    def test_scheduled_callback__evaluates_latest_state_once(self, router, scheduler):
+        sut = ThreadSafeRouter(router=router, scheduler=scheduler)
+        for state in range(10):
+            sut.on_state(state)
+
+        scheduler.run()
+
+        router.on_state.assert_called_once_with(9)
+
+    def test_on_state__after_evaluation__schedules_next_evaluation(
+        self, router, scheduler
+    ):
+        sut = ThreadSafeRouter(router=router, scheduler=scheduler)
+        sut.on_state(1)
+        scheduler.run()
+
+        sut.on_state(2)
+        scheduler.run()
+
+        assert router.on_state.call_count == 2
+        router.on_state.assert_called_with(2)
+
+    def test_on_state__from_many_threads__evaluates_latest_state_once(
+        self, router, scheduler
+    ):
+        sut = ThreadSafeRouter(router=router, scheduler=scheduler)
+        threads = [
+            threading.Thread(target=sut.on_state, args=(state,)) for state in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        sut.on_state("latest")
+
+        scheduler.run()
+
+        router.on_state.assert_called_once_with("latest")
+
+
+class TestAsyncioScheduler:
+    def test_schedule__runs_callback_on_event_loop(self):
+        loop = asyncio.new_event_loop()
+        callback = Mock(side_effect=lambda: loop.stop())
+        sut = AsyncioScheduler(loop)
+
+        threading.Thread(target=sut.schedule, args=(callback,)).start()
+        loop.run_forever()
+        loop.close()
+
+        callback.assert_called_once()
+
+
+class TestTkinterScheduler:
+    def test_schedule__runs_callback_on_next_poll(self):
+        widget = Mock()
+        callback = Mock()
+        sut = TkinterScheduler(widget, interval=10)
+        poll = widget.after.call_args.args[1]
+
+        sut.schedule(callback)
+        callback.assert_not_called()
+        poll()
+
+        callback.assert_called_once()
+        widget.after.assert_called_with(10, poll)
+
+    def test_poll__when_callback_raises__keeps_polling_and_other_callbacks(self):
+        widget = Mock()
+        callback = Mock()
+        sut = TkinterScheduler(widget, interval=10)
+        poll = widget.after.call_args.args[1]
+        sut.schedule(Mock(side_effect=ValueError))
+        sut.schedule(callback)
+        widget.after.reset_mock()
+
+        with pytest.raises(ValueError):
+            poll()
+        widget.after.assert_called_once_with(10, poll)
+        poll()
+
+        callback.assert_called_once()
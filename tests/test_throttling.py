@@ -0,0 +1,112 @@
+import asyncio
+from unittest.mock import PropertyMock, create_autospec
+
+import pytest
+
+from src.pyllot import Debouncer, InvalidEdgesError, Router, ScreenBase, Throttler
+
+WINDOW = 0.02
+
+
+def create_screen(name: str) -> ScreenBase:
+    screen = create_autospec(ScreenBase)
+    type(screen).screen_name = PropertyMock(return_value=name)
+    return screen
+
+
+@pytest.fixture()
+def router() -> Router:
+    router = create_autospec(Router, instance=True)
+    router.current_screen = create_screen("initial")
+    return router
+
+
+def run(coroutine_function) -> None:
+    asyncio.run(coroutine_function())
+
+
+async def wait_for_window() -> None:
+    await asyncio.sleep(WINDOW * 3)
+
+
+class TestDebouncer:
+    def test_when_both_edges_disabled__raises_invalid_edges_error(self, router):
+        with pytest.raises(InvalidEdgesError):
+            Debouncer(router, window=WINDOW, leading=False, trailing=False)
+
+    def test_trailing__evaluates_only_latest_state_after_window(self, router):
+        async def scenario():
+            sut = Debouncer(router, window=WINDOW)
+            for state in range(5):
+                sut.on_state(state)
+            router.on_state.assert_not_called()
+
+            await wait_for_window()
+
+            router.on_state.assert_called_once_with(4)
+
+        run(scenario)
+
+    def test_leading__evaluates_first_state_immediately(self, router):
+        async def scenario():
+            sut = Debouncer(router, window=WINDOW, leading=True, trailing=False)
+            for state in range(5):
+                sut.on_state(state)
+
+            router.on_state.assert_called_once_with(0)
+            await wait_for_window()
+            router.on_state.assert_called_once_with(0)
+
+        run(scenario)
+
+    def test_when_source_screen_changes__resets_window(self, router):
+        async def scenario():
+            sut = Debouncer(router, window=WINDOW, leading=True)
+            sut.on_state(0)
+            sut.on_state(1)
+            router.current_screen = create_screen("foo")
+
+            sut.on_state(2)
+            await wait_for_window()
+
+            assert [call.args[0] for call in router.on_state.call_args_list] == [0, 2]
+
+        run(scenario)
+
+
+class TestThrottler:
+    def test_leading__evaluates_at_most_once_per_window(self, router):
+        async def scenario():
+            sut = Throttler(router, window=WINDOW, leading=True, trailing=False)
+            for state in range(5):
+                sut.on_state(state)
+            await wait_for_window()
+            sut.on_state(5)
+
+            assert [call.args[0] for call in router.on_state.call_args_list] == [0, 5]
+
+        run(scenario)
+
+    def test_trailing__evaluates_latest_state_at_end_of_window(self, router):
+        async def scenario():
+            sut = Throttler(router, window=WINDOW, leading=True)
+            for state in range(5):
+                sut.on_state(state)
+
+            await wait_for_window()
+
+            assert [call.args[0] for call in router.on_state.call_args_list] == [0, 4]
+
+        run(scenario)
+
+    def test_cancel__drops_pending_state(self, router):
+        async def scenario():
+            sut = Throttler(router, window=WINDOW)
+            sut.on_state(0)
+
+            sut.cancel()
+            await wait_for_window()
+
+            router.on_state.assert_not_called()
+
+        run(scenario)